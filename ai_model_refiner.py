@@ -1,15 +1,151 @@
- from core.golden_ratio import phi_scale, phi_inverse_scale
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from core.fileio import atomic_write
+from core.golden_ratio import phi_scale, phi_inverse_scale, phi_scale_array
+from perf.profiling import profiled
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # weights per in-place scaling task
+REFINED_SUFFIX = ".refined.npy"
 
 class AIModelRefiner:
     """
     Optimizes model parameters using Golden Ratio-based scaling.
+
+    List weights are rebuilt as before. NumPy arrays and other writable
+    buffer-protocol objects are scaled in place, in chunks of `chunk_size`
+    spread over `workers` threads (NumPy releases the GIL while scaling).
     """
-    def __init__(self, model):
+    def __init__(self, model, workers=1, chunk_size=DEFAULT_CHUNK_SIZE):
         self.model = model
+        self.workers = workers
+        self.chunk_size = chunk_size
 
+    @profiled()
     def refine(self):
-        for layer in self.model['layers']:
-            layer['weights'] = [phi_scale(w) for w in layer['weights']]
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            tasks = []
+            for layer in self.model['layers']:
+                weights = _as_weight_array(layer['weights'])
+                if weights is None:
+                    layer['weights'] = [phi_scale(w) for w in layer['weights']]
+                    continue
+                if not (weights.flags.writeable and np.issubdtype(weights.dtype, np.floating)):
+                    layer['weights'] = phi_scale_array(weights)
+                    continue
+                tasks.extend(executor.submit(_scale_chunk, chunk) for chunk in self._chunks(weights))
+            for task in tasks:
+                task.result()
         self.model['learning_rate'] = phi_scale(self.model['learning_rate'])
         self.model['dropout_rate'] = phi_inverse_scale(self.model['dropout_rate'])
-        return self.model
\ No newline at end of file
+        return self.model
+
+    def _chunks(self, weights):
+        """Flat views of `chunk_size` weights along the contiguous axis (the whole array if neither order)."""
+        if weights.flags.c_contiguous:
+            flat = weights.reshape(-1)
+        elif weights.flags.f_contiguous:
+            flat = weights.T.reshape(-1)
+        else:
+            return [weights]
+        return [flat[lo:lo + self.chunk_size] for lo in range(0, flat.size, self.chunk_size)]
+
+    @staticmethod
+    def save_checkpoint(model, directory):
+        """
+        Writes a model as one .npy file per layer plus model.json, the
+        layout refine_checkpoint() streams from.
+        """
+        os.makedirs(directory, exist_ok=True)
+        layers = []
+        for index, layer in enumerate(model['layers']):
+            filename = f"layer_{index}.npy"
+            with atomic_write(os.path.join(directory, filename)) as f:
+                np.save(f, np.asarray(layer['weights']))
+            layers.append({**{k: v for k, v in layer.items() if k != 'weights'}, "weights": filename})
+        _write_model(os.path.join(directory, "model.json"),
+                     {**{k: v for k, v in model.items() if k != 'layers'}, "layers": layers})
+
+    @classmethod
+    def refine_checkpoint(cls, directory, workers=1, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Refines a checkpoint on disk one memory-mapped layer at a time, so
+        only the chunks being scaled are resident. Each layer is scaled into
+        a new file (non-float layers become float64, as refine() does for
+        in-memory arrays) that model.json then points to; model.json is
+        rewritten atomically after every layer and lists the finished ones,
+        so re-running an interrupted refinement never scales a layer twice.
+        Returns the refined model description (weights stay as file names).
+        """
+        model_path = os.path.join(directory, "model.json")
+        with open(model_path, 'r') as f:
+            model = json.load(f)
+        refiner = cls(model, workers, chunk_size)
+        done = model.setdefault('refined_layers', [])
+        for index, layer in enumerate(model['layers']):
+            if index in done:
+                continue
+            source, target = layer['weights'], _refined_name(layer['weights'])
+            refiner._write_refined(os.path.join(directory, source), os.path.join(directory, target))
+            layer['weights'] = target
+            done.append(index)
+            _write_model(model_path, model)
+            os.remove(os.path.join(directory, source))
+        model['learning_rate'] = phi_scale(model['learning_rate'])
+        model['dropout_rate'] = phi_inverse_scale(model['dropout_rate'])
+        del model['refined_layers']
+        _write_model(model_path, model)
+        return model
+
+    def _write_refined(self, source_path, target_path):
+        """Streams the scaled copy of one layer file into `target_path`."""
+        source = np.load(source_path, mmap_mode='r')
+        dtype = source.dtype if np.issubdtype(source.dtype, np.floating) else np.float64
+        with atomic_write(target_path) as f:
+            target = np.lib.format.open_memmap(
+                f.name, mode='w+', dtype=dtype, shape=source.shape,
+                fortran_order=source.flags.f_contiguous and not source.flags.c_contiguous)
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                list(executor.map(_refine_chunk, self._chunks(source), self._chunks(target)))
+            target.flush()
+            del target
+        del source
+
+
+def _refined_name(name):
+    """Alternates a layer between `<stem>.npy` and `<stem>.refined.npy` on each refinement."""
+    if name.endswith(REFINED_SUFFIX):
+        return name[:-len(REFINED_SUFFIX)] + ".npy"
+    return os.path.splitext(name)[0] + REFINED_SUFFIX
+
+
+def _write_model(path, model):
+    with atomic_write(path, 'w') as f:
+        json.dump(model, f, indent=2)
+
+
+def _as_weight_array(weights):
+    """A NumPy view of array/buffer weights (no copy), or None for plain lists."""
+    if isinstance(weights, np.ndarray):
+        return weights
+    if isinstance(weights, (list, tuple)):
+        return None
+    try:
+        return np.asarray(memoryview(weights))
+    except TypeError:
+        return None
+
+
+def _scale_chunk(chunk):
+    if chunk.dtype == np.float64 and chunk.flags.c_contiguous:
+        phi_scale_array(chunk, out=chunk)
+    else:
+        chunk[...] = phi_scale_array(chunk)
+
+
+def _refine_chunk(source, target):
+    if target.dtype == np.float64:
+        phi_scale_array(np.asarray(source, dtype=np.float64), out=target)
+    else:
+        target[...] = phi_scale_array(source)
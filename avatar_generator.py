@@ -1,9 +1,103 @@
+import hashlib
+import numpy as np
+
+MESH_SCALE = 0.1  # scan units -> avatar mesh units
+INT16_MAX = np.iinfo(np.int16).max
+
 class AvatarGenerator:
     """
     Creates avatars from body scan data for real-time gameplay or visual representation.
+    With an AvatarStore, avatars are kept quantized and handed out as read-only views.
     """
-    def create_avatar(self, scan_data):
+    def __init__(self, store=None):
+        self.store = store
+
+    def create_avatar(self, scan_data, avatar_id=None, texture="default"):
         if scan_data is None:
             raise ValueError("No body scan data provided.")
+        if self.store is not None and avatar_id is not None:
+            self.store.add(avatar_id, scan_data, texture, unit=MESH_SCALE)
+            return self.store.get(avatar_id)
         # Minimal representation: scale the mesh data
-        return {"mesh": scan_data * 0.1, "texture": "default"}
\ No newline at end of file
+        return {"mesh": scan_data * 0.1, "texture": texture}
+
+
+class AvatarStore:
+    """
+    Compact storage for many live avatars.
+
+    Each mesh is quantized to int16 (or float16) with one scale per avatar
+    and its points are stored in a fixed shuffled order, so every prefix is
+    an evenly decimated subset: level-of-detail k is simply the first
+    n / 2**k points, a view rather than a copy. Identical textures are
+    stored once and shared.
+    """
+    def __init__(self, quantization="int16", lod_levels=3, seed=0):
+        if quantization not in ("int16", "float16"):
+            raise ValueError("quantization must be 'int16' or 'float16'.")
+        self.quantization = quantization
+        self.lod_levels = lod_levels
+        self.rng = np.random.default_rng(seed)
+        self.avatars = {}
+        self.textures = {}
+        self._texture_refs = {}
+
+    def add(self, avatar_id, points, texture="default", unit=1.0):
+        points = np.asarray(points)
+        if points.ndim != 2 or points.shape[1] != 3:
+            raise ValueError("Avatar points must have shape (n, 3).")
+        if avatar_id in self.avatars:
+            self.remove(avatar_id)
+        extent = float(np.abs(points).max()) if points.size else 0.0
+        extent = extent or 1.0
+        if self.quantization == "int16":
+            mesh = np.rint(points * (INT16_MAX / extent)).astype(np.int16)
+            scale = extent * unit / INT16_MAX
+        else:
+            mesh = (points * (1.0 / extent)).astype(np.float16)
+            scale = extent * unit
+        mesh = mesh[self.rng.permutation(len(mesh))]
+        mesh.flags.writeable = False
+        self.avatars[avatar_id] = (mesh, scale, self._intern_texture(texture))
+
+    def get(self, avatar_id, lod=0):
+        """Read-only view of an avatar: quantized mesh prefix, scale and shared texture."""
+        mesh, scale, texture_key = self.avatars[avatar_id]
+        return {"mesh": mesh[:self.lod_size(len(mesh), lod)], "scale": scale,
+                "texture": self.textures[texture_key]}
+
+    def lod_size(self, points, lod):
+        if not 0 <= lod <= self.lod_levels:
+            raise ValueError(f"lod must be between 0 and {self.lod_levels}.")
+        return max(1, -(-points // (1 << lod))) if points else 0
+
+    def dequantize(self, avatar_id, lod=0, dtype=np.float32):
+        """Mesh in avatar units; this is the one call that allocates."""
+        avatar = self.get(avatar_id, lod)
+        return avatar["mesh"].astype(dtype) * dtype(avatar["scale"])
+
+    def remove(self, avatar_id):
+        _, _, texture_key = self.avatars.pop(avatar_id)
+        self._texture_refs[texture_key] -= 1
+        if not self._texture_refs[texture_key]:
+            del self._texture_refs[texture_key], self.textures[texture_key]
+
+    def _intern_texture(self, texture):
+        if isinstance(texture, np.ndarray):
+            digest = hashlib.sha1(texture.tobytes())
+            digest.update(f"{texture.dtype}{texture.shape}".encode())
+            key = digest.hexdigest()
+            if key not in self.textures:
+                texture = texture.copy()
+                texture.flags.writeable = False
+        else:
+            key = texture
+        self.textures.setdefault(key, texture)
+        self._texture_refs[key] = self._texture_refs.get(key, 0) + 1
+        return key
+
+    @property
+    def nbytes(self):
+        meshes = sum(mesh.nbytes for mesh, _, _ in self.avatars.values())
+        textures = sum(t.nbytes for t in self.textures.values() if isinstance(t, np.ndarray))
+        return meshes + textures
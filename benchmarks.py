@@ -0,0 +1,230 @@
+"""
+Benchmark suite for the EternaFX hot paths.
+
+    python -m perf.benchmarks                      # every case up to 10^6
+    python -m perf.benchmarks --max-scale 1e8      # full run
+    python -m perf.benchmarks --only prime_gap_analyzer zeta_function
+
+Each case runs in a fresh process (so peak RSS belongs to that case) and
+reports the best wall time of `repeat` runs, peak RSS and the tracemalloc
+peak of one extra traced run. Results are appended to a JSON history and
+compared with the best of the last BASELINE_RUNS recorded runs; a metric
+above its threshold ratio is a regression and makes the command exit 1.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from core.fileio import atomic_write
+
+DEFAULT_HISTORY = os.path.join(".benchmarks", "history.json")  # git-ignored
+DEFAULT_MAX_SCALE = 10 ** 6
+BASELINE_RUNS = 5
+THRESHOLDS = {"wall_time": 1.25, "peak_rss": 1.20, "peak_alloc": 1.20}
+NOISE_FLOOR_SECONDS = 1e-3  # wall times below this are too noisy to flag
+
+
+class Benchmark:
+    """A named case: setup(scale) builds the input and returns the callable that is timed."""
+    def __init__(self, name, scales, setup):
+        self.name = name
+        self.scales = scales
+        self.setup = setup
+
+
+def _prime_gap_analyzer(scale):
+    from ai.prime_gap_analyzer import PrimeGapAnalyzer
+    return lambda: PrimeGapAnalyzer(prime_limit=scale, backend="sieve")
+
+
+def _zeta_function(scale):
+    from zeta_function import calculate_zeta_values
+    side = int(round(scale ** 0.5))
+    # Critical strip: points outside it can fall back to mpmath and would dominate the timing.
+    real_range, imag_range = np.linspace(0.0, 1.0, side), np.linspace(1.0, 100.0, side)
+    return lambda: calculate_zeta_values(real_range, imag_range)
+
+
+def _golden_ratio(scale):
+    from core.golden_ratio import phi_scale_array
+    values = np.random.default_rng(0).standard_normal(scale)
+    out = np.empty_like(values)
+    return lambda: phi_scale_array(values, out=out)
+
+
+def _ai_model_refiner(scale):
+    from ai.ai_model_refiner import AIModelRefiner
+    original = np.random.default_rng(0).standard_normal(scale)
+    weights = np.empty_like(original)
+
+    def refine():
+        # refine() scales in place: restore the inputs so every repeat does the same work.
+        np.copyto(weights, original)
+        model = {"layers": [{"weights": weights}], "learning_rate": 0.01, "dropout_rate": 0.5}
+        return AIModelRefiner(model).refine()
+    return refine
+
+
+def _save_load(scale):
+    from core.save_load import save_game_state_binary, load_game_state_lazy
+    workspace = tempfile.TemporaryDirectory(prefix="eternafx-bench-")
+    filename = os.path.join(workspace.name, "world.sav")
+    state = {"player": {"name": "Turing", "knowledge": 2.5},
+             "terrain": np.random.default_rng(0).standard_normal(scale).astype(np.float32)}
+
+    def round_trip(workspace=workspace):
+        # Change the payload each repeat; an identical section would be skipped as unchanged.
+        state["terrain"][0] += 1
+        save_game_state_binary(filename, state, dirty_sections={"terrain"})
+        with load_game_state_lazy(filename) as lazy:
+            return lazy["terrain"]
+    return round_trip
+
+
+def _nlp_pipeline(scale):
+    from natural_language_processing import TextPipeline
+    pipeline = TextPipeline()
+    words = ["the", "cats", "were", "chasing", "geese", "across", "golden", "spirals", "and", "primes"]
+    documents = [" ".join(words[(i + j) % len(words)] for j in range(20)) for i in range(scale // 20)]
+    return lambda: sum(len(tokens) for tokens in pipeline.stream(documents))
+
+
+BENCHMARKS = {b.name: b for b in (
+    Benchmark("prime_gap_analyzer", (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7, 10 ** 8), _prime_gap_analyzer),
+    Benchmark("zeta_function", (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6), _zeta_function),
+    Benchmark("golden_ratio", (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7), _golden_ratio),
+    Benchmark("ai_model_refiner", (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7, 10 ** 8), _ai_model_refiner),
+    Benchmark("save_load", (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7, 10 ** 8), _save_load),
+    Benchmark("nlp_pipeline", (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6), _nlp_pipeline),
+)}
+
+
+def _peak_rss():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # bytes on macOS, KiB elsewhere
+
+
+def run_case(name, scale, repeat=3, trace=True):
+    """Runs one case in this process and returns its metrics."""
+    try:
+        run = BENCHMARKS[name].setup(scale)
+    except (ImportError, LookupError) as error:
+        reason = next((line.strip() for line in str(error).splitlines() if any(c.isalpha() for c in line)), "")
+        return {"skipped": f"{type(error).__name__}: {reason}"}
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    peak_alloc = None
+    if trace:
+        tracemalloc.start()
+        run()
+        peak_alloc = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {"wall_time": min(times), "peak_rss": _peak_rss(), "peak_alloc": peak_alloc}
+
+
+def run_suite(names=None, max_scale=DEFAULT_MAX_SCALE, repeat=3, trace=True, isolate=True, report=None):
+    """
+    Runs every selected case up to `max_scale`; keys are '<name>@<scale>'.
+    report(key, result) is called as each case finishes.
+    """
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    for name in names or BENCHMARKS:
+        for scale in BENCHMARKS[name].scales:
+            if scale > max_scale:
+                continue
+            if isolate:
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    result = executor.submit(run_case, name, scale, repeat, trace).result()
+            else:
+                result = run_case(name, scale, repeat, trace)
+            key = f"{name}@{scale}"
+            results[key] = result
+            if report is not None:
+                report(key, result)
+    return results
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r') as f:
+        return json.load(f)["runs"]
+
+
+def record_run(path, results):
+    """Appends a run to the history file, written atomically."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    runs = load_history(path)
+    runs.append({
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    })
+    with atomic_write(path, 'w') as f:
+        json.dump({"runs": runs}, f, indent=2)
+
+
+def find_regressions(history, results, thresholds=THRESHOLDS):
+    """Messages for every metric worse than threshold x its best value in the last BASELINE_RUNS runs."""
+    regressions = []
+    recent = history[-BASELINE_RUNS:]
+    for key, result in results.items():
+        for metric, ratio in thresholds.items():
+            value = result.get(metric)
+            previous = [run["results"][key][metric] for run in recent
+                        if run["results"].get(key, {}).get(metric) is not None]
+            if value is None or not previous:
+                continue
+            baseline = min(previous)
+            if metric == "wall_time" and baseline < NOISE_FLOOR_SECONDS:
+                continue
+            if baseline > 0 and value > ratio * baseline:
+                regressions.append(f"{key} {metric}: {value:.4g} vs baseline {baseline:.4g} "
+                                   f"(x{value / baseline:.2f} > x{ratio})")
+    return regressions
+
+
+def _format(result):
+    if "skipped" in result:
+        return f"skipped ({result['skipped']})"
+    alloc = "-" if result["peak_alloc"] is None else f"{result['peak_alloc'] / 2 ** 20:.1f} MiB"
+    return (f"{result['wall_time'] * 1e3:10.2f} ms  rss {result['peak_rss'] / 2 ** 20:8.1f} MiB  "
+            f"alloc {alloc}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="cases to run")
+    parser.add_argument("--max-scale", type=float, default=DEFAULT_MAX_SCALE)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--history", default=DEFAULT_HISTORY)
+    parser.add_argument("--no-trace", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--no-isolate", action="store_true", help="run every case in this process")
+    parser.add_argument("--no-record", action="store_true", help="compare only, do not append to the history")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.only, int(args.max_scale), args.repeat, not args.no_trace, not args.no_isolate,
+                        report=lambda key, result: print(f"{key:28s} {_format(result)}", flush=True))
+    regressions = find_regressions(load_history(args.history), results)
+    if not args.no_record:
+        record_run(args.history, results)
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,10 @@
+import asyncio
 import numpy as np
 import time
-from core.golden_ratio import phi_scale
+from core.golden_ratio import phi_scale, phi_scale_array
+
+SCAN_DURATION = 1.5  # seconds per simulated acquisition
+POINTS_PER_SCAN = 100
 
 class BodyScanner:
     """
@@ -12,8 +16,8 @@ class BodyScanner:
 
     def perform_scan(self, user_id):
         print(f"Scanning user: {user_id} ...")
-        time.sleep(1.5)
-        self.scan_data = np.random.rand(100, 3) * 100
+        time.sleep(SCAN_DURATION)
+        self.scan_data = np.random.rand(POINTS_PER_SCAN, 3) * 100
         print("Scan complete.")
 
     def get_scan_summary(self):
@@ -24,4 +28,66 @@ class BodyScanner:
             "Height": phi_scale(dimensions[2]),
             "Width": phi_scale(dimensions[0]),
             "Depth": phi_scale(dimensions[1])
-        }
\ No newline at end of file
+        }
+
+
+class BodyScanService:
+    """
+    Asyncio scanning service for onboarding queues: overlaps up to
+    `max_concurrency` acquisitions, stacks each batch into a single
+    (users x points x 3) array and summarizes it in one vectorized pass.
+    """
+    def __init__(self, max_concurrency=256, scan_duration=SCAN_DURATION, seed=None):
+        self.max_concurrency = max_concurrency
+        self.scan_duration = scan_duration
+        self.rng = np.random.default_rng(seed)
+        self.scans_completed = 0
+        self.batches_completed = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.busy_time = 0.0
+        self._semaphore = None
+        self._loop = None
+
+    async def acquire_scan(self, user_id, out):
+        """Acquires one scan into `out` (a points x 3 slot of the batch array)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._semaphore, self._loop = asyncio.Semaphore(self.max_concurrency), loop
+        started = time.perf_counter()
+        async with self._semaphore:
+            await asyncio.sleep(self.scan_duration)
+            self.rng.random(out=out)
+            out *= 100
+        latency = time.perf_counter() - started
+        self.scans_completed += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    async def scan_batch(self, user_ids):
+        """Scans every user concurrently and returns the stacked point clouds."""
+        scans = np.empty((len(user_ids), POINTS_PER_SCAN, 3))
+        started = time.perf_counter()
+        await asyncio.gather(*(self.acquire_scan(user_id, scans[i]) for i, user_id in enumerate(user_ids)))
+        self.busy_time += time.perf_counter() - started
+        self.batches_completed += 1
+        return scans
+
+    @staticmethod
+    def summarize_batch(scans):
+        """get_scan_summary for a whole (users x points x 3) batch at once."""
+        dimensions = phi_scale_array(np.ptp(scans, axis=1))
+        return {
+            "Height": dimensions[:, 2],
+            "Width": dimensions[:, 0],
+            "Depth": dimensions[:, 1]
+        }
+
+    def get_stats(self):
+        return {
+            "Scans": self.scans_completed,
+            "Batches": self.batches_completed,
+            "Throughput (scans/s)": round(self.scans_completed / self.busy_time, 2) if self.busy_time else 0.0,
+            "Mean Latency (s)": round(self.total_latency / self.scans_completed, 4) if self.scans_completed else 0.0,
+            "Max Latency (s)": round(self.max_latency, 4)
+        }
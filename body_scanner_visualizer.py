@@ -1,21 +1,37 @@
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
+from visualization.rendering import DEFAULT_CLOUD_POINTS, decimate_points, render_with_budget, save_figure
 
 class BodyScannerVisualizer:
     @staticmethod
-    def visualize_scan(scan_data):
-        """
-        3D scatter plot of the scanned data for real-time insights.
-        """
-        if scan_data is None:
-            print("No body scan data to visualize.")
-            return
-        
+    def _figure(scan_data, max_points, method):
+        points = decimate_points(scan_data, max_points, method)
         fig = plt.figure()
         ax = fig.add_subplot(111, projection="3d")
-        ax.scatter(scan_data[:,0], scan_data[:,1], scan_data[:,2], c='blue', marker='o')
+        ax.scatter(points[:,0], points[:,1], points[:,2], c='blue', marker='o')
         ax.set_xlabel("X")
         ax.set_ylabel("Y")
         ax.set_zlabel("Z")
         ax.set_title("3D Body Scanner Visualization")
-        plt.show()
\ No newline at end of file
+        return fig
+
+    @staticmethod
+    def visualize_scan(scan_data, max_points=DEFAULT_CLOUD_POINTS, method="voxel", path=None, budget=None):
+        """
+        3D scatter plot of the scanned data for real-time insights.
+        Clouds larger than `max_points` are voxel- (or randomly) decimated
+        first. With `path` the plot is exported headlessly instead of
+        shown; `budget` (seconds) then picks the point count.
+        """
+        if scan_data is None:
+            print("No body scan data to visualize.")
+            return
+
+        if path is None:
+            BodyScannerVisualizer._figure(scan_data, max_points, method)
+            plt.show()
+        elif budget is None:
+            save_figure(BodyScannerVisualizer._figure(scan_data, max_points, method), path)
+        else:
+            render_with_budget(lambda n: BodyScannerVisualizer._figure(scan_data, n, method),
+                               path, budget, max_points)
@@ -0,0 +1,95 @@
+# data_processing.py
+
+import os
+import struct
+import numpy as np
+import pandas as pd
+from core.fileio import atomic_write
+
+DEFAULT_CHUNK_ROWS = 1 << 16
+DTYPES = (np.float32, np.float64)
+NPY_HEADER_BYTES = 128  # fixed-size .npy header, rewritten in place once the row count is known
+
+def process_data(data):
+    # Perform data cleaning and preprocessing
+    data = pd.DataFrame(data)
+    data = data.dropna()  # Remove missing values
+    data = data.astype(float, copy=False)  # Convert to float
+    return data
+
+
+def _check_dtype(dtype):
+    dtype = np.dtype(dtype)
+    if dtype not in DTYPES:
+        raise ValueError(f"Unsupported dtype {dtype}, expected float32 or float64.")
+    return dtype
+
+
+def iter_blocks(path, dtype=np.float64, chunk_rows=DEFAULT_CHUNK_ROWS, columns=None):
+    """
+    Yields C-contiguous 2-D `dtype` blocks of at most `chunk_rows` rows from
+    a .csv, .parquet or .npy file. Values are cast while parsing, so no
+    full-width object or float64 copy of the file is ever built.
+
+    `columns` selects and orders the output columns: header names for
+    .csv and .parquet, integer positions for .npy (which has no names).
+    """
+    dtype = _check_dtype(dtype)
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        for chunk in pd.read_csv(path, chunksize=chunk_rows, dtype=dtype, usecols=columns):
+            if columns is not None:
+                chunk = chunk[list(columns)]  # usecols keeps file order; match the requested one
+            yield np.ascontiguousarray(chunk.to_numpy(dtype=dtype, copy=False))
+    elif extension == ".parquet":
+        import pyarrow.parquet as pq
+        parquet = pq.ParquetFile(path)
+        for batch in parquet.iter_batches(batch_size=chunk_rows, columns=columns):
+            block = np.empty((batch.num_rows, batch.num_columns), dtype=dtype)
+            for j, column in enumerate(batch.columns):
+                block[:, j] = column.to_numpy(zero_copy_only=False)
+            yield block
+    elif extension == ".npy":
+        array = np.load(path, mmap_mode='r')
+        if array.ndim == 1:
+            array = array[:, None]
+        if columns is not None:
+            array = array[:, columns]
+        for start in range(0, len(array), chunk_rows):
+            yield np.ascontiguousarray(array[start:start + chunk_rows], dtype=dtype)
+    else:
+        raise ValueError(f"Unsupported input format '{extension}', expected .csv, .parquet or .npy.")
+
+
+def _npy_header(dtype, shape):
+    header = repr({"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False, "shape": shape})
+    prefix = b"\x93NUMPY\x01\x00"
+    padding = NPY_HEADER_BYTES - len(prefix) - 2 - len(header) - 1
+    if padding < 0:
+        raise ValueError(f"Shape {shape} does not fit in the .npy header.")
+    return prefix + struct.pack("<H", NPY_HEADER_BYTES - len(prefix) - 2) + (header + " " * padding + "\n").encode()
+
+
+def ingest(path, output, dtype=np.float64, chunk_rows=DEFAULT_CHUNK_ROWS, columns=None):
+    """
+    Streams `path` block by block into the .npy file `output`, dropping
+    rows that contain NaN, and returns it as a read-only memory map. Only
+    one block is held in memory at a time; rows are appended straight to
+    the file and the header is patched with the final row count.
+    """
+    dtype = _check_dtype(dtype)
+    rows, width = 0, None
+    with atomic_write(output) as f:
+        f.write(b"\0" * NPY_HEADER_BYTES)
+        for block in iter_blocks(path, dtype, chunk_rows, columns):
+            if width is None:
+                width = block.shape[1]
+            keep = ~np.isnan(block).any(axis=1)
+            if not keep.all():
+                block = np.compress(keep, block, axis=0)
+            f.write(block.data)
+            rows += len(block)
+        f.seek(0)
+        f.write(_npy_header(dtype, (rows, width or 0)))
+    return np.load(output, mmap_mode='r')
+
@@ -0,0 +1,160 @@
+import numpy as np
+
+DEFAULT_CAPACITY = 1024
+
+class EntityRegistry:
+    """
+    Structure-of-arrays store for many players: harmony, chaos and
+    knowledge live in NumPy columns, so a server tick applies every
+    queued delta in one vectorized step instead of one method call per
+    player. add() hands out EntityHandle objects that keep the
+    HarmonyController / Player API working for single-entity code.
+    """
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.names = []
+        self.harmony = np.zeros(capacity)
+        self.chaos = np.zeros(capacity)
+        self.knowledge = np.zeros(capacity)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.generation = np.zeros(capacity, dtype=np.int64)  # bumped on remove(), invalidating old handles
+        self._pending_ids, self._pending_deltas = [], []
+        self._free = []
+
+    def __len__(self):
+        return int(self.active.sum())
+
+    def add(self, name, knowledge_level=1.0, harmony_level=50.0, chaos_level=50.0):
+        if self._free:
+            index = self._free.pop()
+            self.names[index] = name
+        else:
+            index = len(self.names)
+            if index == len(self.harmony):
+                self._grow()
+            self.names.append(name)
+        self.harmony[index] = harmony_level
+        self.chaos[index] = chaos_level
+        self.knowledge[index] = knowledge_level
+        self.active[index] = True
+        return EntityHandle(self, index, int(self.generation[index]))
+
+    def remove(self, handle):
+        index = handle._row()
+        self.active[index] = False
+        self.names[index] = None
+        self.generation[index] += 1
+        self._free.append(index)
+        # Deltas queued for the removed entity must not reach whoever reuses the row.
+        for k, ids in enumerate(self._pending_ids):
+            keep = ids != index
+            if not keep.all():
+                self._pending_ids[k], self._pending_deltas[k] = ids[keep], self._pending_deltas[k][:, keep]
+
+    def _check_ids(self, ids):
+        ids = np.asarray(ids, dtype=np.intp)
+        if ids.size and (ids.min() < 0 or ids.max() >= len(self.active) or not self.active[ids].all()):
+            raise ValueError("Deltas target rows that hold no active entity.")
+        return ids
+
+    def _grow(self):
+        capacity = 2 * len(self.harmony)
+        for column in ("harmony", "chaos", "knowledge", "active", "generation"):
+            old = getattr(self, column)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, column, new)
+
+    def apply_deltas(self, ids, harmony_delta=0.0, chaos_delta=0.0, knowledge_delta=0.0):
+        """Applies per-entity deltas at once; repeated ids accumulate. Every id must be an active row."""
+        ids = self._check_ids(ids)
+        for column, delta in ((self.harmony, harmony_delta), (self.chaos, chaos_delta),
+                              (self.knowledge, knowledge_delta)):
+            if np.any(delta):
+                np.add.at(column, ids, np.broadcast_to(delta, ids.shape))
+
+    def queue_deltas(self, ids, harmony_delta=0.0, chaos_delta=0.0, knowledge_delta=0.0):
+        """Buffers deltas until the next tick(); remove() discards those queued for the removed entity."""
+        ids = self._check_ids(ids)
+        deltas = np.empty((3, len(ids)))
+        deltas[0], deltas[1], deltas[2] = harmony_delta, chaos_delta, knowledge_delta
+        self._pending_ids.append(ids)
+        self._pending_deltas.append(deltas)
+
+    def tick(self):
+        """Folds every queued delta into the columns in a single vectorized step."""
+        if not self._pending_ids:
+            return
+        ids = np.concatenate(self._pending_ids)
+        deltas = np.concatenate(self._pending_deltas, axis=1)
+        self._pending_ids, self._pending_deltas = [], []
+        size = len(self.harmony)
+        self.harmony += np.bincount(ids, deltas[0], minlength=size)
+        self.chaos += np.bincount(ids, deltas[1], minlength=size)
+        self.knowledge += np.bincount(ids, deltas[2], minlength=size)
+
+    def get_status(self):
+        """HarmonyController.get_status for every active entity, as arrays."""
+        return {
+            "Harmony": np.round(self.harmony[self.active], 2),
+            "Chaos": np.round(self.chaos[self.active], 2)
+        }
+
+
+class EntityHandle:
+    """
+    Lightweight view of one registry row, usable wherever a Player or
+    HarmonyController was used. Using a handle after its entity was
+    removed raises ValueError, even once the row has been reused.
+    """
+    __slots__ = ("registry", "index", "generation")
+
+    def __init__(self, registry, index, generation=0):
+        self.registry = registry
+        self.index = index
+        self.generation = generation
+
+    def _row(self):
+        if self.registry.generation[self.index] != self.generation:
+            raise ValueError(f"Entity handle for row {self.index} is stale: the entity was removed.")
+        return self.index
+
+    @property
+    def name(self):
+        return self.registry.names[self._row()]
+
+    @property
+    def knowledge_level(self):
+        return float(self.registry.knowledge[self._row()])
+
+    @knowledge_level.setter
+    def knowledge_level(self, value):
+        self.registry.knowledge[self._row()] = value
+
+    @property
+    def harmony_level(self):
+        return float(self.registry.harmony[self._row()])
+
+    @harmony_level.setter
+    def harmony_level(self, value):
+        self.registry.harmony[self._row()] = value
+
+    @property
+    def chaos_level(self):
+        return float(self.registry.chaos[self._row()])
+
+    @chaos_level.setter
+    def chaos_level(self, value):
+        self.registry.chaos[self._row()] = value
+
+    def gain_knowledge(self, amount: float):
+        self.registry.knowledge[self._row()] += amount
+
+    def update_metrics(self, harmony_delta, chaos_delta):
+        index = self._row()
+        self.registry.harmony[index] += harmony_delta
+        self.registry.chaos[index] += chaos_delta
+
+    def get_status(self):
+        return {
+            "Harmony": round(self.harmony_level, 2),
+            "Chaos": round(self.chaos_level, 2)}
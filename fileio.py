@@ -0,0 +1,28 @@
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+@contextmanager
+def atomic_write(path: str, mode: str = 'wb', fsync: bool = False):
+    """
+    Yields a file object for a temporary file next to `path` and renames it
+    over `path` once the block succeeds, so readers never see a partial
+    file. On any error the temporary file is removed and the error re-raised.
+    fsync=True also flushes the data to disk before the rename. f.name is
+    the temporary path, for writers that need to reopen it (e.g. memmaps).
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f"{name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        with open(tmp_path, mode) as f:
+            yield f
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
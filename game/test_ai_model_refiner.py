@@ -0,0 +1,59 @@
+import os
+import numpy as np
+import pytest
+from ai.ai_model_refiner import AIModelRefiner
+from core.golden_ratio import phi_scale
+
+def test_array_weights_refined_in_place():
+    weights = np.linspace(-2, 2, 1001)
+    expected = [phi_scale(w) for w in weights.tolist()]
+    model = {'layers': [{'weights': weights}, {'weights': [1.0, 2.0]}],
+             'learning_rate': 0.01, 'dropout_rate': 0.5}
+    refined = AIModelRefiner(model, workers=2, chunk_size=100).refine()
+    assert refined['layers'][0]['weights'] is weights
+    assert weights.tolist() == expected
+    assert refined['layers'][1]['weights'] == [phi_scale(1.0), phi_scale(2.0)]
+
+def test_refine_checkpoint_streams_layers(tmp_path):
+    weights = np.random.default_rng(3).normal(size=(40, 25))
+    model = {'layers': [{'name': 'dense', 'weights': weights}], 'learning_rate': 0.01, 'dropout_rate': 0.5}
+    AIModelRefiner.save_checkpoint(model, str(tmp_path))
+    refined = AIModelRefiner.refine_checkpoint(str(tmp_path), chunk_size=64)
+    assert refined['layers'] == [{'name': 'dense', 'weights': 'layer_0.refined.npy'}]
+    assert refined['learning_rate'] == phi_scale(0.01)
+    assert sorted(os.listdir(tmp_path)) == ['layer_0.refined.npy', 'model.json']
+    on_disk = np.load(tmp_path / 'layer_0.refined.npy')
+    assert on_disk.ravel().tolist() == [phi_scale(w) for w in weights.ravel().tolist()]
+
+def test_refine_checkpoint_converts_int_and_chunks_fortran_layers(tmp_path):
+    ints = np.arange(-50, 50, dtype=np.int32).reshape(10, 10)
+    fortran = np.asfortranarray(np.random.default_rng(4).normal(size=(30, 20)))
+    model = {'layers': [{'weights': ints}, {'weights': fortran}], 'learning_rate': 0.01, 'dropout_rate': 0.5}
+    AIModelRefiner.save_checkpoint(model, str(tmp_path))
+    chunks = AIModelRefiner(model, chunk_size=64)._chunks(np.load(tmp_path / 'layer_1.npy', mmap_mode='r'))
+    assert max(chunk.size for chunk in chunks) == 64
+    AIModelRefiner.refine_checkpoint(str(tmp_path), workers=2, chunk_size=64)
+    converted = np.load(tmp_path / 'layer_0.refined.npy')
+    assert converted.dtype == np.float64
+    assert converted.ravel().tolist() == [phi_scale(float(w)) for w in ints.ravel().tolist()]
+    scaled = np.load(tmp_path / 'layer_1.refined.npy')
+    assert scaled.flags.f_contiguous
+    assert scaled.ravel().tolist() == [phi_scale(w) for w in fortran.ravel().tolist()]
+
+def test_interrupted_refine_checkpoint_resumes_without_rescaling(tmp_path, monkeypatch):
+    layers = [np.full(100, 2.0), np.full(100, 3.0)]
+    model = {'layers': [{'weights': w} for w in layers], 'learning_rate': 0.01, 'dropout_rate': 0.5}
+    AIModelRefiner.save_checkpoint(model, str(tmp_path))
+    write_refined = AIModelRefiner._write_refined
+    def fail_on_second_layer(self, source, target):
+        if 'layer_1' in source:
+            raise KeyboardInterrupt
+        write_refined(self, source, target)
+    monkeypatch.setattr(AIModelRefiner, '_write_refined', fail_on_second_layer)
+    with pytest.raises(KeyboardInterrupt):
+        AIModelRefiner.refine_checkpoint(str(tmp_path))
+    monkeypatch.setattr(AIModelRefiner, '_write_refined', write_refined)
+    refined = AIModelRefiner.refine_checkpoint(str(tmp_path))
+    assert 'refined_layers' not in refined and refined['learning_rate'] == phi_scale(0.01)
+    for layer, weights in zip(refined['layers'], layers):
+        assert np.load(tmp_path / layer['weights']).tolist() == [phi_scale(w) for w in weights.tolist()]
@@ -0,0 +1,17 @@
+import numpy as np
+from scanner.avatar_generator import AvatarGenerator, AvatarStore
+
+def test_compact_avatars_share_textures_and_views():
+    store = AvatarStore(lod_levels=2)
+    generator = AvatarGenerator(store)
+    texture = np.arange(48, dtype=np.uint8).reshape(4, 4, 3)
+    scan = np.random.default_rng(5).random((100, 3)) * 100
+    avatar = generator.create_avatar(scan, avatar_id="a", texture=texture)
+    generator.create_avatar(scan, avatar_id="b", texture=texture.copy())
+
+    assert avatar["mesh"].dtype == np.int16 and not avatar["mesh"].flags.writeable
+    assert len(store.textures) == 1
+    lod = store.get("a", lod=2)["mesh"]
+    assert len(lod) == 25 and np.shares_memory(lod, avatar["mesh"])
+    restored = np.sort(store.dequantize("a", dtype=np.float64), axis=0)
+    assert np.allclose(restored, np.sort(scan * 0.1, axis=0), atol=avatar["scale"])
@@ -0,0 +1,21 @@
+import numpy as np
+from perf.benchmarks import BENCHMARKS, main, run_suite, find_regressions, load_history
+
+def test_suite_records_history_and_flags_regressions(tmp_path):
+    history = str(tmp_path / "history.json")
+    results = run_suite(["golden_ratio", "save_load"], max_scale=10 ** 3, repeat=1, isolate=False)
+    assert set(results) == {"golden_ratio@1000", "save_load@1000"}
+    assert all(r["wall_time"] > 0 and r["peak_rss"] > 0 and r["peak_alloc"] > 0 for r in results.values())
+
+    assert main(["--only", "golden_ratio", "--max-scale", "1e3", "--no-isolate", "--history", history]) == 0
+    slower = {"golden_ratio@1000": {**load_history(history)[0]["results"]["golden_ratio@1000"]}}
+    slower["golden_ratio@1000"]["peak_alloc"] *= 2
+    regressions = find_regressions(load_history(history), slower)
+    assert len(regressions) == 1 and regressions[0].startswith("golden_ratio@1000 peak_alloc")
+
+def test_repeats_do_the_same_work():
+    refine = BENCHMARKS["ai_model_refiner"].setup(1000)
+    first = refine()["layers"][0]["weights"].copy()
+    np.testing.assert_array_equal(refine()["layers"][0]["weights"], first)
+    round_trip = BENCHMARKS["save_load"].setup(1000)
+    assert round_trip()[0] + 1 == round_trip()[0]
@@ -0,0 +1,18 @@
+import asyncio
+import numpy as np
+from scanner.body_scanner import BodyScanner, BodyScanService
+
+def test_batch_summary_matches_single_scan():
+    service = BodyScanService(max_concurrency=8, scan_duration=0, seed=42)
+    scans = asyncio.run(service.scan_batch([f"user-{i}" for i in range(20)]))
+    assert scans.shape == (20, 100, 3)
+
+    summary = BodyScanService.summarize_batch(scans)
+    scanner = BodyScanner()
+    for i in (0, 19):
+        scanner.scan_data = scans[i]
+        single = scanner.get_scan_summary()
+        assert [summary[k][i] for k in ("Height", "Width", "Depth")] == list(single.values())
+
+    stats = service.get_stats()
+    assert stats["Scans"] == 20 and stats["Batches"] == 1
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("pandas")
+from data_processing import ingest, iter_blocks
+
+def _expected(rows):
+    return rows[~np.isnan(rows).any(axis=1)]
+
+def test_csv_ingest_drops_nan_rows_into_memmap(tmp_path):
+    rows = np.arange(30, dtype=np.float64).reshape(10, 3)
+    rows[[2, 7], 1] = np.nan
+    source = tmp_path / "data.csv"
+    source.write_text("a,b,c\n" + "\n".join(",".join("" if np.isnan(v) else str(v) for v in row) for row in rows))
+    result = ingest(str(source), str(tmp_path / "data.npy"), dtype=np.float32, chunk_rows=4)
+    assert isinstance(result, np.memmap) and result.dtype == np.float32
+    np.testing.assert_array_equal(result, _expected(rows).astype(np.float32))
+
+def test_npy_ingest_in_blocks(tmp_path):
+    rows = np.random.default_rng(0).standard_normal((1000, 4))
+    rows[::97, 2] = np.nan
+    np.save(tmp_path / "raw.npy", rows)
+    assert [len(b) for b in iter_blocks(str(tmp_path / "raw.npy"), chunk_rows=300)] == [300, 300, 300, 100]
+    result = ingest(str(tmp_path / "raw.npy"), str(tmp_path / "clean.npy"), chunk_rows=300)
+    np.testing.assert_array_equal(result, _expected(rows))
+
+def test_csv_columns_follow_the_requested_order(tmp_path):
+    source = tmp_path / "data.csv"
+    source.write_text("a,b,c\n1,2,3\n4,5,6\n")
+    blocks = list(iter_blocks(str(source), columns=["c", "a"]))
+    np.testing.assert_array_equal(np.concatenate(blocks), [[3, 1], [6, 4]])
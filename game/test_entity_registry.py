@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from core.entity_registry import EntityRegistry
+from core.harmony_controller import HarmonyController
+
+def test_handle_matches_single_entity_api():
+    registry = EntityRegistry(capacity=2)
+    controller = HarmonyController()
+    handles = [registry.add(f"player-{i}") for i in range(5)]
+    for handle in (handles[3], controller):
+        handle.update_metrics(1.25, -0.5)
+    assert handles[3].get_status() == controller.get_status()
+    handles[3].gain_knowledge(2.0)
+    assert handles[3].knowledge_level == 3.0 and handles[3].name == "player-3"
+
+def test_tick_applies_queued_deltas_once():
+    registry = EntityRegistry()
+    handles = [registry.add(name) for name in ("Turing", "Newton", "Noether")]
+    registry.queue_deltas([0, 2, 2], harmony_delta=[1.0, 2.0, 3.0], chaos_delta=-1.0)
+    registry.queue_deltas([1], knowledge_delta=0.5)
+    assert handles[2].harmony_level == 50.0
+    registry.tick()
+    np.testing.assert_allclose(registry.get_status()["Harmony"], [51.0, 50.0, 55.0])
+    assert handles[2].chaos_level == 48.0 and handles[1].knowledge_level == 1.5
+    registry.remove(handles[0])
+    assert len(registry) == 2 and registry.add("Gauss").index == 0
+
+def test_removed_handles_are_rejected():
+    registry = EntityRegistry()
+    stale = registry.add("Turing")
+    registry.remove(stale)
+    with pytest.raises(ValueError):
+        registry.remove(stale)
+    reused = registry.add("Gauss")
+    assert reused.index == stale.index and len(registry._free) == 0
+    with pytest.raises(ValueError):
+        stale.update_metrics(1.0, 1.0)
+    assert reused.harmony_level == 50.0
+
+def test_batch_deltas_never_reach_a_reused_row():
+    registry = EntityRegistry()
+    turing = registry.add("Turing")
+    registry.queue_deltas([turing.index], harmony_delta=60.0)
+    registry.remove(turing)
+    gauss = registry.add("Gauss")
+    registry.tick()
+    assert gauss.index == turing.index and gauss.harmony_level == 50.0
+    with pytest.raises(ValueError):
+        registry.apply_deltas([5], harmony_delta=1.0)
+    with pytest.raises(ValueError):
+        registry.queue_deltas([-1], harmony_delta=1.0)
@@ -0,0 +1,14 @@
+import os
+import pytest
+from core.fileio import atomic_write
+
+def test_atomic_write_replaces_or_leaves_no_trace(tmp_path):
+    path = str(tmp_path / "state.json")
+    with atomic_write(path, 'w') as f:
+        f.write("first")
+    with pytest.raises(RuntimeError):
+        with atomic_write(path, 'w') as f:
+            f.write("partial")
+            raise RuntimeError("interrupted")
+    assert open(path).read() == "first"
+    assert os.listdir(tmp_path) == ["state.json"]
@@ -0,0 +1,28 @@
+import numpy as np
+from core.golden_ratio import (
+    phi_scale, phi_inverse_scale, phi_harmonic_series,
+    phi_scale_array, phi_inverse_scale_array, phi_harmonic_array
+)
+
+def test_array_scaling_is_bit_identical():
+    values = np.random.default_rng(7).normal(scale=1000, size=5000)
+    for factor in (1.0, 3, -2, 0.5):
+        expected = [phi_scale(v, factor) for v in values.tolist()]
+        assert phi_scale_array(values, factor).tolist() == expected
+        expected = [phi_inverse_scale(v, factor) for v in values.tolist()]
+        assert phi_inverse_scale_array(values, factor).tolist() == expected
+    assert phi_harmonic_array(50).tolist() == phi_harmonic_series(50)
+
+def test_in_place_scaling():
+    weights = np.linspace(-1, 1, 11)
+    expected = [phi_scale(w) for w in weights.tolist()]
+    result = phi_scale_array(weights, out=weights)
+    assert result is weights
+    assert weights.tolist() == expected
+
+def test_fortran_ordered_out_is_accepted():
+    values = np.random.default_rng(8).normal(size=(30, 20))
+    expected = [[phi_scale(v) for v in row] for row in values.tolist()]
+    fortran = np.asfortranarray(values)
+    assert phi_scale_array(fortran, out=fortran).tolist() == expected
+    assert phi_scale_array(values, out=np.empty((30, 20), order='F')).tolist() == expected
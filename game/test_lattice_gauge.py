@@ -0,0 +1,22 @@
+import numpy as np
+from scipy.special import iv
+from lattice_gauge import LatticeGauge
+
+def test_2d_plaquette_matches_exact_result():
+    # In two dimensions plaquettes are independent: <P> = I1/I0 (U1), I2/I1 (SU2).
+    for group, expected in (("U1", iv(1, 2.0) / iv(0, 2.0)), ("SU2", iv(2, 2.0) / iv(1, 2.0))):
+        lattice = LatticeGauge(size=16, dims=2, group=group, beta=2.0, hits=3, seed=1)
+        records = lattice.run(60)
+        assert abs(np.mean([r["plaquette"] for r in records[20:]]) - expected) < 0.02
+        assert 0.0 < records[-1]["acceptance"] < 1.0
+
+def test_checkpoint_resume_continues_the_same_chain(tmp_path):
+    checkpoint = str(tmp_path / "su2.npz")
+    straight = LatticeGauge(size=4, dims=4, seed=7)
+    straight.run(6)
+    first = LatticeGauge(size=4, dims=4, seed=7)
+    first.run(3, checkpoint=checkpoint)
+    resumed = LatticeGauge.from_checkpoint(checkpoint)
+    resumed.run(3)
+    np.testing.assert_array_equal(resumed.links, straight.links)
+    assert resumed.history == straight.history
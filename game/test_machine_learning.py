@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+from machine_learning import StreamingLinearRegression, iter_chunks, train_model_streaming
+
+def _data(rows=5000, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.standard_normal((rows, 3))
+    y = X @ np.array([1.5, -2.0, 0.5]) + 3.0 + 0.01 * rng.standard_normal(rows)
+    return X, y
+
+def test_streaming_fit_recovers_coefficients_and_scores_holdout():
+    X, y = _data()
+    model = train_model_streaming(iter_chunks(X, y, 700), n_features=3)
+    np.testing.assert_allclose(model.coef_, [1.5, -2.0, 0.5], atol=1e-2)
+    assert abs(model.intercept_ - 3.0) < 1e-2
+    assert 0.15 < model.test.count / len(y) < 0.25
+    assert model.score() > 0.999
+
+def test_parallel_fit_and_resume_match_serial(tmp_path):
+    X, y = _data()
+    serial = train_model_streaming(iter_chunks(X, y, 500), n_features=3)
+    parallel = train_model_streaming(iter_chunks(X, y, 500), n_features=3, workers=2)
+    np.testing.assert_allclose(parallel.weights, serial.weights)
+    assert parallel.test.count == serial.test.count
+
+    path = str(tmp_path / "model.json")
+    train_model_streaming(iter_chunks(X[:2500], y[:2500], 500), n_features=3).save(path)
+    resumed = train_model_streaming(iter_chunks(X[2500:], y[2500:], 500), n_features=3,
+                                    model=StreamingLinearRegression.load(path))
+    np.testing.assert_allclose(resumed.weights, serial.weights)
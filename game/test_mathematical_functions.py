@@ -0,0 +1,27 @@
+import numpy as np
+from scipy import sparse
+from mathematical_functions import (
+    calculate_eigenvalues, calculate_eigenvectors, eigendecomposition, top_eigenpairs, clear_cache
+)
+
+def test_symmetric_matrix_is_decomposed_once():
+    clear_cache()
+    x = np.random.default_rng(0).standard_normal((40, 40))
+    matrix = x.T @ x
+    values = calculate_eigenvalues(matrix)
+    vectors = calculate_eigenvectors(matrix.copy())
+    assert vectors is eigendecomposition(matrix)[1]
+    assert values.dtype == np.float64 and np.all(np.diff(values) >= 0)
+    np.testing.assert_allclose(matrix @ vectors, vectors * values, atol=1e-9)
+
+def test_general_matrix_uses_eig():
+    matrix = np.array([[0.0, 1.0], [-2.0, -3.0]])
+    np.testing.assert_allclose(sorted(calculate_eigenvalues(matrix).real), [-2.0, -1.0])
+
+def test_top_eigenpairs_on_sparse_laplacian():
+    n = 200
+    laplacian = sparse.diags([-np.ones(n - 1), 2 * np.ones(n), -np.ones(n - 1)], [-1, 0, 1], format="csr")
+    values, vectors = top_eigenpairs(laplacian, k=3)
+    expected = 2 - 2 * np.cos(np.pi * np.arange(n, n - 3, -1) / (n + 1))
+    np.testing.assert_allclose(values, expected, rtol=1e-8)
+    assert vectors.shape == (n, 3)
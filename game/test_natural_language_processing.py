@@ -0,0 +1,22 @@
+import pytest
+
+pytest.importorskip("nltk")
+from natural_language_processing import TextPipeline, tokenize_text, remove_stopwords, lemmatize_tokens
+
+def _pipeline():
+    try:
+        return TextPipeline(lemma_cache_size=8)
+    except LookupError:
+        pytest.skip("NLTK stopwords/wordnet data not installed")
+
+def test_pipeline_matches_function_chain():
+    pipeline = _pipeline()
+    documents = ["The cats were chasing the mice.", "Geese and cats"] * 3
+    expected = [lemmatize_tokens(remove_stopwords(tokenize_text(text))) for text in documents]
+    assert list(pipeline.stream(documents)) == expected
+    assert pipeline.lemmatize.cache_info().hits > 0
+
+def test_parallel_stream_preserves_order():
+    pipeline = _pipeline()
+    documents = [f"document {i} about geese" for i in range(50)]
+    assert list(pipeline.stream_parallel(documents, workers=2, batch_size=7)) == list(pipeline.stream(documents))
@@ -0,0 +1,31 @@
+import numpy as np
+from navier_stokes import IncompressibleFlow, taylor_green
+
+def test_taylor_green_stays_divergence_free_and_decays():
+    flow = IncompressibleFlow((64, 64), viscosity=0.1, velocity=taylor_green((64, 64)))
+    energy = flow.kinetic_energy()
+    flow.run(20)
+    assert np.abs(flow.divergence()).max() < 1e-12
+    assert abs(flow.kinetic_energy() / energy - np.exp(-0.4 * flow.time)) < 0.05
+
+def test_3d_projection_removes_divergence():
+    rng = np.random.default_rng(0)
+    flow = IncompressibleFlow((8, 8, 8), velocity=rng.standard_normal((3, 8, 8, 8)))
+    assert np.abs(flow.divergence()).max() < 1e-12
+
+def test_slab_workers_match_serial_run():
+    serial = IncompressibleFlow((16, 16), viscosity=0.05, velocity=taylor_green((16, 16)))
+    serial.run(5)
+    with IncompressibleFlow((16, 16), viscosity=0.05, velocity=taylor_green((16, 16)), workers=2) as slabs:
+        slabs.run(5)
+        np.testing.assert_array_equal(slabs.velocity, serial.velocity)
+        np.testing.assert_array_equal(slabs.pressure, serial.pressure)
+
+def test_forced_slab_workers_match_serial_run():
+    forcing = np.random.default_rng(1).standard_normal((2, 16, 16))
+    serial = IncompressibleFlow((16, 16), viscosity=0.05, velocity=taylor_green((16, 16)), forcing=forcing)
+    serial.run(5)
+    with IncompressibleFlow((16, 16), viscosity=0.05, velocity=taylor_green((16, 16)), forcing=forcing,
+                            workers=2) as slabs:
+        slabs.run(5)
+        np.testing.assert_array_equal(slabs.velocity, serial.velocity)
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from ai.prime_gap_analyzer import PrimeGapAnalyzer
 
 def test_prime_generation():
@@ -8,4 +9,62 @@ def test_prime_generation():
 
 def test_gap_calculation():
     analyzer = PrimeGapAnalyzer(prime_limit=50)
-    assert len(analyzer.prime_gaps) == len(analyzer.primes) - 1
\ No newline at end of file
+    assert len(analyzer.prime_gaps) == len(analyzer.primes) - 1
+
+def test_sieve_backend_matches_sympy():
+    reference = PrimeGapAnalyzer(prime_limit=5000)
+    analyzer = PrimeGapAnalyzer(prime_limit=5000, backend="sieve", segment_size=97)
+    assert analyzer.primes.dtype == np.uint32
+    assert analyzer.primes.tolist() == reference.primes
+    assert analyzer.prime_gaps.tolist() == reference.prime_gaps
+    assert analyzer.gap_ratios.tolist() == reference.gap_ratios
+
+
+def test_streaming_resume_matches_single_pass(tmp_path):
+    full = PrimeGapAnalyzer(prime_limit=20000, backend="sieve", streaming=True, segment_size=1000)
+    full.run_stream()
+
+    first = PrimeGapAnalyzer(prime_limit=7777, backend="sieve", streaming=True, segment_size=1000)
+    first.run_stream()
+    checkpoint = tmp_path / "gaps.json"
+    first.save_checkpoint(str(checkpoint))
+    resumed = PrimeGapAnalyzer.from_checkpoint(str(checkpoint), prime_limit=20000)
+    resumed.run_stream()
+
+    assert resumed.statistics.to_dict() == full.statistics.to_dict()
+    reference = PrimeGapAnalyzer(prime_limit=20000, backend="sieve")
+    assert full.statistics.gap_count == len(reference.prime_gaps)
+    assert full.statistics.ratio_count == len(reference.gap_ratios)
+
+
+def test_parallel_scan_matches_serial():
+    serial = PrimeGapAnalyzer(prime_limit=30000, backend="sieve", segment_size=1000)
+    parallel = PrimeGapAnalyzer(prime_limit=30000, backend="sieve", segment_size=1000, workers=2)
+    assert parallel.primes.tolist() == serial.primes.tolist()
+    parallel.detect_wave_patterns()
+    serial.detect_wave_patterns()
+    assert np.array_equal(parallel.wave_patterns, serial.wave_patterns)
+
+    serial_stream = PrimeGapAnalyzer(prime_limit=30000, backend="sieve", segment_size=1000, streaming=True)
+    serial_stream.run_stream()
+    parallel_stream = PrimeGapAnalyzer(prime_limit=30000, backend="sieve", segment_size=1000,
+                                       streaming=True, workers=2)
+    parallel_stream.run_stream()
+    assert parallel_stream.statistics.to_dict() == serial_stream.statistics.to_dict()
+    assert parallel_stream.last_prime == serial_stream.last_prime
+
+
+def test_prime_cache_serves_sub_ranges(tmp_path):
+    cache_dir = str(tmp_path / "primes")
+    first = PrimeGapAnalyzer(prime_limit=10000, backend="sieve", cache_dir=cache_dir)
+    assert first.cache.entries() == [(2, 10000)]
+
+    smaller = PrimeGapAnalyzer(prime_limit=500, backend="sieve", cache_dir=cache_dir)
+    assert smaller.cache.entries() == [(2, 10000)]
+    assert isinstance(smaller.primes, np.memmap)
+    assert smaller.primes.tolist() == PrimeGapAnalyzer(prime_limit=500).primes
+    assert smaller.prime_gaps.tolist() == PrimeGapAnalyzer(prime_limit=500).prime_gaps
+
+    primes, gaps = first.cache.lookup(1000, 2000)
+    assert primes[0] == 1009 and primes[-1] == 1999
+    assert gaps.tolist() == np.diff(primes).tolist()
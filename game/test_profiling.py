@@ -0,0 +1,37 @@
+import numpy as np
+from perf import profiling
+from perf.profiling import profiled, stage
+
+@profiled("test.allocate")
+def allocate(n):
+    return np.ones(n)
+
+@profiled("test.blocks")
+def blocks(count):
+    for i in range(count):
+        yield i
+
+def test_metrics_are_opt_in():
+    profiling.disable()
+    profiling.reset()
+    allocate(10)
+    assert profiling.snapshot() == {}
+
+def test_timing_tracing_and_sinks():
+    records = []
+    profiling.reset()
+    profiling.enable(trace=True)
+    profiling.add_sink(lambda name, record: records.append(name))
+    try:
+        allocate(1 << 20)
+        assert list(blocks(3)) == [0, 1, 2]
+        with stage("test.block"):
+            allocate(10)
+    finally:
+        profiling.disable()
+        profiling._sinks.clear()
+    metrics = profiling.snapshot()
+    assert metrics["test.allocate"]["calls"] == 2
+    assert metrics["test.allocate"]["peak_alloc"] >= 8 << 20
+    assert metrics["test.blocks"]["calls"] == 1
+    assert records == ["test.allocate", "test.blocks", "test.allocate", "test.block"]
@@ -0,0 +1,51 @@
+import time
+import numpy as np
+import pytest
+from visualization.rendering import (
+    minmax_downsample, lttb_downsample, decimate_points, downsample_grid, render_with_budget
+)
+
+def test_line_downsampling_keeps_extremes_and_endpoints():
+    y = np.sin(np.linspace(0, 50, 100_000))
+    y[31_337] = 9.0
+    x, kept = minmax_downsample(y, 1000)
+    assert len(kept) <= 1000 and kept.max() == 9.0 and kept.min() == y.min()
+    assert np.all(np.diff(x) > 0)
+    x, kept = lttb_downsample(y, 500)
+    assert len(kept) == 500 and x[0] == 0 and x[-1] == len(y) - 1 and 9.0 in kept
+
+def test_point_and_surface_decimation():
+    points = np.random.default_rng(0).standard_normal((50_000, 3))
+    for method in ("voxel", "random"):
+        assert 0 < len(decimate_points(points, 2000, method)) <= 2000
+    x, y, z = downsample_grid(np.arange(500 * 300).reshape(500, 300), 64)
+    assert z.shape[0] <= 65 and z.shape[1] <= 65
+    assert (x[-1], y[-1], z[-1, -1]) == (499, 299, 500 * 300 - 1)
+
+def test_headless_export_within_budget(tmp_path):
+    pytest.importorskip("matplotlib")
+    from visualization.prime_gap_visualizer import PrimeGapVisualizer
+    gaps = np.random.default_rng(1).integers(1, 40, 200_000).astype(float)
+    PrimeGapVisualizer.visualize(gaps, gaps[1:] / gaps[:-1], path=str(tmp_path / "gaps.png"), budget=2.0)
+    assert (tmp_path / "gaps_gaps.png").stat().st_size > 0
+    assert (tmp_path / "gaps_ratios.png").stat().st_size > 0
+
+def test_nan_buckets_are_skipped():
+    y = np.arange(10_000, dtype=float)
+    y[2000:6000] = np.nan
+    x, kept = minmax_downsample(y, 100)
+    assert not np.isnan(kept).any() and kept.max() == 9999.0
+    assert len(minmax_downsample(np.full(10_000, np.nan), 100)[1]) == 0
+
+def test_budget_includes_probes_and_overhead(tmp_path):
+    class SlowFigure:
+        def __init__(self, points):
+            self.points = points
+
+        def write_html(self, path, include_plotlyjs=None):
+            time.sleep(0.05 + 1e-5 * self.points)
+
+    start = time.perf_counter()
+    points = render_with_budget(SlowFigure, str(tmp_path / "figure.html"), budget=0.5, max_points=10 ** 6)
+    assert time.perf_counter() - start <= 0.55
+    assert 10_000 < points < 40_000
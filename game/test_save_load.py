@@ -0,0 +1,51 @@
+import os
+import numpy as np
+import pytest
+from core.save_load import (
+    save_game_state, load_game_state, save_game_state_binary, load_game_state_lazy, migrate_json_save
+)
+
+def test_json_save_migrates_to_binary(tmp_path):
+    filename = str(tmp_path / "world.sav")
+    save_game_state(filename, {"player": {"name": "Turing", "knowledge": 2.5}})
+    migrate_json_save(filename)
+    assert load_game_state(filename) == {"player": {"name": "Turing", "knowledge": 2.5}}
+
+def test_binary_save_appends_only_changed_sections(tmp_path):
+    filename = str(tmp_path / "world.sav")
+    state = {"player": {"level": 1}, "terrain": np.arange(10000, dtype=np.float32)}
+    save_game_state_binary(filename, state)
+    size = os.path.getsize(filename + ".0.dat")
+
+    state["player"]["level"] = 2
+    save_game_state_binary(filename, state)
+    assert os.path.getsize(filename + ".0.dat") - size < 100
+
+    with load_game_state_lazy(filename) as lazy:
+        assert lazy["player"] == {"level": 2}
+        assert np.array_equal(lazy["terrain"], state["terrain"])
+
+def test_lazy_view_survives_compaction(tmp_path, monkeypatch):
+    import core.save_load
+    monkeypatch.setattr(core.save_load, "COMPACT_MIN_BYTES", 0)
+    filename = str(tmp_path / "world.sav")
+    save_game_state_binary(filename, {"terrain": np.zeros(1000)})
+    with load_game_state_lazy(filename) as lazy:
+        for level in range(1, 4):
+            save_game_state_binary(filename, {"terrain": np.full(1000, float(level))})
+        assert not os.path.exists(filename + ".0.dat")
+        assert np.array_equal(lazy["terrain"], np.zeros(1000))
+    with load_game_state_lazy(filename) as lazy:
+        assert np.array_equal(lazy["terrain"], np.full(1000, 3.0))
+
+def test_every_save_kind_opens_with_the_same_api(tmp_path):
+    json_file, binary_file = str(tmp_path / "world.json"), str(tmp_path / "world.sav")
+    save_game_state(json_file, {1: "one"})
+    save_game_state_binary(binary_file, {1: "one"})
+    for filename, expected in ((json_file, {"1": "one"}), (binary_file, {"1": "one"}),
+                               (str(tmp_path / "missing.sav"), {})):
+        with load_game_state_lazy(filename) as state:
+            assert dict(state) == expected
+    with pytest.raises(TypeError):
+        save_game_state_binary(str(tmp_path / "bad.sav"), {(1, 2): "pair"})
+    assert not os.path.exists(str(tmp_path / "bad.sav.0.dat"))
@@ -0,0 +1,23 @@
+import numpy as np
+from ai.scenario_generator import ScenarioGenerator, build_alias_table
+from core.harmony_controller import HarmonyController
+
+def test_seeded_batches_are_reproducible():
+    first = ScenarioGenerator(seed=42).generate_batch(50)
+    second = ScenarioGenerator(seed=42).generate_batch(50)
+    assert first == second
+    assert set(first) <= set(ScenarioGenerator.potential_breakthroughs)
+
+def test_alias_table_matches_weights():
+    weights = np.array([1.0, 0.0, 3.0, 6.0])
+    prob, alias = build_alias_table(weights)
+    implied = prob.copy()
+    np.add.at(implied, alias, 1.0 - prob)
+    np.testing.assert_allclose(implied / len(weights), weights / weights.sum())
+
+def test_chaos_shifts_scenario_weights():
+    controller = HarmonyController()
+    controller.update_metrics(-50.0, 50.0)
+    generator = ScenarioGenerator(seed=1, controller=controller)
+    counts = np.bincount(generator.draw_indices(20000), minlength=6)
+    assert counts.argmax() == 2  # Navier–Stokes turbulence dominates under pure chaos
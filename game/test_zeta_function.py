@@ -0,0 +1,85 @@
+import os
+import numpy as np
+from zeta_function import (
+    calculate_zeta_values, evaluate_zeta_grid, refine_zeta_values, ZetaTileCache,
+    critical_zeros, extract_critical_zeros, ZeroTable, _choose_n
+)
+
+def test_vectorized_matches_mpmath():
+    real_range = np.linspace(0.1, 0.99, 7)
+    imag_range = np.linspace(0, 50, 9)
+    fast = calculate_zeta_values(real_range, imag_range)
+    reference = calculate_zeta_values(real_range, imag_range, method="mpmath")
+    assert np.allclose(fast, reference, rtol=0, atol=1e-8)
+
+def test_error_bound_and_pole():
+    values, bound = evaluate_zeta_grid([1.0, 2.0], [0.0], return_error=True)
+    assert np.isinf(values[0, 0].real)
+    assert abs(values[1, 0] - np.pi ** 2 / 6) <= bound[1, 0] + 1e-15
+
+def test_tiles_are_reused_when_panning():
+    cache = ZetaTileCache()
+    real_range = np.linspace(0.1, 0.99, 10)
+    first = calculate_zeta_values(real_range, np.linspace(0, 20, 201), method="tiled",
+                                  tile_size=16, cache=cache)
+    assert np.allclose(first, calculate_zeta_values(real_range, np.linspace(0, 20, 201)), atol=1e-7)
+    tiles_before = len(cache.tiles)
+    calculate_zeta_values(real_range, np.linspace(5, 25, 201), method="tiled", tile_size=16, cache=cache)
+    assert len(cache.tiles) - tiles_before == 3
+
+def test_refinement_ends_on_full_grid():
+    real_range, imag_range = np.linspace(0.1, 0.99, 9), np.linspace(0, 10, 33)
+    shapes = [values.shape for _, _, values in refine_zeta_values(real_range, imag_range, levels=2,
+                                                                   cache=ZetaTileCache())]
+    assert shapes == [(3, 9), (5, 17), (9, 33)]
+
+def test_batch_zeros_match_zetazero(tmp_path):
+    zeros = critical_zeros(10)
+    assert np.allclose(zeros, [float(extract_critical_zeros(k).imag) for k in range(1, 11)], atol=1e-9)
+
+    table = ZeroTable(str(tmp_path / "zeros"))
+    assert abs(table.zero(10) - zeros[9]) < 1e-9
+    window, first_index = ZeroTable(str(tmp_path / "zeros")).between(20, 40)
+    assert first_index == 2
+    assert np.allclose(window, zeros[1:6], atol=1e-9)
+
+def test_tiles_off_the_lattice_use_exact_heights():
+    real_range = np.linspace(0.1, 0.99, 5)
+    imag_range = 3.12345678 + np.arange(40)
+    tiled = calculate_zeta_values(real_range, imag_range, method="tiled", tile_size=16, cache=ZetaTileCache())
+    assert np.allclose(tiled, calculate_zeta_values(real_range, imag_range), rtol=0, atol=1e-8)
+
+def test_tiles_survive_eviction_during_assembly():
+    real_range, imag_range = np.linspace(0.1, 0.99, 20), np.linspace(0, 20, 81)
+    tiled = calculate_zeta_values(real_range, imag_range, method="tiled", tile_size=8,
+                                  cache=ZetaTileCache(max_tiles=4))
+    assert np.allclose(tiled, calculate_zeta_values(real_range, imag_range), rtol=0, atol=1e-8)
+
+def test_pole_does_not_inflate_the_truncation():
+    real_range, imag_range = np.linspace(0, 1, 50), np.linspace(0, 50, 50)
+    s = real_range[:, None] + 1j * imag_range[None, :]
+    assert _choose_n(s, 1e-8) == _choose_n(s[:-1], 1e-8)
+    assert np.isinf(calculate_zeta_values(real_range, imag_range)[-1, 0])
+
+def test_relative_tolerance_avoids_fallback_left_of_the_strip(monkeypatch):
+    import zeta_function
+    real_range, imag_range = np.linspace(-2, -1, 5), np.linspace(60, 100, 9)
+    reference = calculate_zeta_values(real_range, imag_range, method="mpmath")
+    fallbacks, mpmath_zeta = [], zeta_function.zeta
+    monkeypatch.setattr(zeta_function, "zeta", lambda s: fallbacks.append(s) or mpmath_zeta(s))
+    absolute = calculate_zeta_values(real_range, imag_range)
+    assert len(fallbacks) > 0
+    fallbacks.clear()
+    relative = calculate_zeta_values(real_range, imag_range, rtol=1e-10)
+    assert fallbacks == []
+    assert np.allclose(relative, reference, rtol=1e-10, atol=1e-8)
+    assert np.allclose(absolute, reference, rtol=0, atol=1e-8)
+
+def test_zero_table_stores_height_with_zeros(tmp_path):
+    table = ZeroTable(str(tmp_path / "zeros"))
+    table.extend_to_height(40)
+    reopened = ZeroTable(str(tmp_path / "zeros"))
+    assert reopened.height == 40.0 and len(reopened) == len(table) == 6
+    reopened.extend_to_height(50)
+    assert np.all(np.diff(reopened.zeros) > 0)
+    assert os.listdir(tmp_path) == ["zeros.table.npy"]
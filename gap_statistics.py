@@ -0,0 +1,97 @@
+import math
+import numpy as np
+from core.golden_ratio import PHI
+
+LOG_PHI = math.log(PHI)
+PHI_POWER_SPAN = 16  # ratio histogram covers PHI**-16 .. PHI**16
+
+class GapStatistics:
+    """
+    Running prime gap statistics, updated block by block so that a scan
+    never needs every gap in memory at once.
+
+    Ratios are binned against PHI: bin k counts ratios closest to PHI**k.
+    """
+    def __init__(self):
+        self.gap_count = 0
+        self.gap_total = 0
+        self.max_gap = 0
+        self.gap_histogram = np.zeros(0, dtype=np.int64)
+        self.ratio_count = 0
+        self.below_phi = 0
+        self.above_phi = 0
+        self.phi_power_histogram = np.zeros(2 * PHI_POWER_SPAN + 1, dtype=np.int64)
+
+    @property
+    def mean_gap(self) -> float:
+        return self.gap_total / self.gap_count if self.gap_count else 0.0
+
+    def update(self, raw_gaps: np.ndarray, ratios: np.ndarray):
+        if len(raw_gaps):
+            self.gap_count += len(raw_gaps)
+            self.gap_total += int(raw_gaps.sum(dtype=np.uint64))
+            self.max_gap = max(self.max_gap, int(raw_gaps.max()))
+            counts = np.bincount(raw_gaps)
+            if len(counts) > len(self.gap_histogram):
+                counts[:len(self.gap_histogram)] += self.gap_histogram
+                self.gap_histogram = counts
+            else:
+                self.gap_histogram[:len(counts)] += counts
+        if len(ratios):
+            self.ratio_count += len(ratios)
+            self.below_phi += int(np.count_nonzero(ratios < PHI))
+            self.above_phi += int(np.count_nonzero(ratios > PHI))
+            powers = np.rint(np.log(ratios) / LOG_PHI).astype(np.int64)
+            np.clip(powers, -PHI_POWER_SPAN, PHI_POWER_SPAN, out=powers)
+            self.phi_power_histogram += np.bincount(
+                powers + PHI_POWER_SPAN, minlength=len(self.phi_power_histogram)
+            )
+
+    def merge(self, other: "GapStatistics"):
+        """Folds another set of statistics into this one."""
+        self.gap_count += other.gap_count
+        self.gap_total += other.gap_total
+        self.max_gap = max(self.max_gap, other.max_gap)
+        if len(other.gap_histogram) > len(self.gap_histogram):
+            self.gap_histogram, other_histogram = other.gap_histogram.copy(), self.gap_histogram
+        else:
+            other_histogram = other.gap_histogram
+        self.gap_histogram[:len(other_histogram)] += other_histogram
+        self.ratio_count += other.ratio_count
+        self.below_phi += other.below_phi
+        self.above_phi += other.above_phi
+        self.phi_power_histogram += other.phi_power_histogram
+
+    def summary(self) -> dict:
+        return {
+            "Gaps": self.gap_count,
+            "Mean Gap": round(self.mean_gap, 8),
+            "Max Gap": self.max_gap,
+            "Ratios Below PHI": self.below_phi,
+            "Ratios Above PHI": self.above_phi,
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "gap_count": self.gap_count,
+            "gap_total": self.gap_total,
+            "max_gap": self.max_gap,
+            "gap_histogram": self.gap_histogram.tolist(),
+            "ratio_count": self.ratio_count,
+            "below_phi": self.below_phi,
+            "above_phi": self.above_phi,
+            "phi_power_histogram": self.phi_power_histogram.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GapStatistics":
+        stats = cls()
+        stats.gap_count = data["gap_count"]
+        stats.gap_total = data["gap_total"]
+        stats.max_gap = data["max_gap"]
+        stats.gap_histogram = np.array(data["gap_histogram"], dtype=np.int64)
+        stats.ratio_count = data["ratio_count"]
+        stats.below_phi = data["below_phi"]
+        stats.above_phi = data["above_phi"]
+        stats.phi_power_histogram = np.array(data["phi_power_histogram"], dtype=np.int64)
+        return stats
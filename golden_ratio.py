@@ -1,7 +1,17 @@
 import math
+from functools import lru_cache
+import numpy as np
+from perf.profiling import profiled
 
 PHI = (1 + math.sqrt(5)) / 2  # Golden Ratio constant
 
+POWER_TABLE_SPAN = 64  # integer factors in [-64, 64] come from PHI_POWERS
+PHI_POWERS = np.array([PHI ** float(k) for k in range(-POWER_TABLE_SPAN, POWER_TABLE_SPAN + 1)])
+PHI_POWERS.flags.writeable = False
+ROUND_SCALE = 1e8  # phi_* helpers round to 8 decimals
+EXACT_ROUND_LIMIT = 2.0 ** 52 / ROUND_SCALE  # beyond this, value * 1e8 loses the integer part
+BLOCK_SIZE = 1 << 16  # elements per temporary block in the array helpers
+
 def phi_scale(value: float, factor: float = 1.0) -> float:
     """Scales a value using the Golden Ratio."""
     return round(value * (PHI ** factor), 8)
@@ -12,4 +22,64 @@ def phi_inverse_scale(value: float, factor: float = 1.0) -> float:
 
 def phi_harmonic_series(n: int) -> list:
     """Generates a harmonic series based on the Golden Ratio."""
-    return [round(PHI / (i + 1), 8) for i in range(n)]
\ No newline at end of file
+    return [round(PHI / (i + 1), 8) for i in range(n)]
+
+@lru_cache(maxsize=256)
+def phi_power(factor: float) -> float:
+    """PHI ** factor, read from PHI_POWERS for integer factors (same bits either way)."""
+    factor = float(factor)
+    if factor.is_integer() and abs(factor) <= POWER_TABLE_SPAN:
+        return float(PHI_POWERS[int(factor) + POWER_TABLE_SPAN])
+    return PHI ** factor
+
+def _round8(block: np.ndarray, out: np.ndarray):
+    """
+    Vectorized round(x, 8) with Python's exact semantics: np.rint on x * 1e8
+    is only trusted away from half-way ties and below EXACT_ROUND_LIMIT;
+    the few remaining elements go through the builtin round().
+    """
+    with np.errstate(over='ignore', invalid='ignore'):
+        shifted = block * ROUND_SCALE
+        rounded = np.rint(shifted)
+        tie_margin = np.abs(shifted) * 4.5e-16 + 1e-9
+        doubtful = ~(np.abs(block) < EXACT_ROUND_LIMIT) | (np.abs(np.abs(shifted - rounded) - 0.5) <= tie_margin)
+        np.divide(rounded, ROUND_SCALE, out=out)
+    for i in np.flatnonzero(doubtful):
+        out[i] = round(float(block[i]), 8)
+
+def _phi_apply(values, factor, out, inverse: bool) -> np.ndarray:
+    values = np.asarray(values, dtype=np.float64)
+    if out is None:
+        out = np.empty_like(values)
+    elif out.shape != values.shape or out.dtype != np.float64:
+        raise ValueError("out must be a float64 array with the same shape as values.")
+    multiplier = phi_power(factor)
+    if not out.flags.forc:
+        raise ValueError("out must be C- or Fortran-contiguous.")
+    # Walk both arrays in out's memory order so flat_out is a view, not a copy.
+    order = 'C' if out.flags.c_contiguous else 'F'
+    flat_values, flat_out = values.ravel(order=order), out.ravel(order=order)
+    for lo in range(0, flat_values.size, BLOCK_SIZE):
+        block = flat_values[lo:lo + BLOCK_SIZE]
+        block = block / multiplier if inverse else block * multiplier
+        _round8(block, flat_out[lo:lo + BLOCK_SIZE])
+    return out
+
+@profiled()
+def phi_scale_array(values, factor: float = 1.0, out=None) -> np.ndarray:
+    """
+    Array form of phi_scale: element-wise identical results. Pass out=values
+    to scale in place; work is done in BLOCK_SIZE chunks, so no full-size
+    temporaries are allocated.
+    """
+    return _phi_apply(values, factor, out, inverse=False)
+
+def phi_inverse_scale_array(values, factor: float = 1.0, out=None) -> np.ndarray:
+    """Array form of phi_inverse_scale, with the same out= semantics as phi_scale_array."""
+    return _phi_apply(values, factor, out, inverse=True)
+
+def phi_harmonic_array(n: int) -> np.ndarray:
+    """phi_harmonic_series as a float64 array."""
+    series = np.empty(n)
+    _round8(PHI / np.arange(1, n + 1, dtype=np.float64), series)
+    return series
@@ -0,0 +1,206 @@
+# machine_learning.py
+
+import json
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import numpy as np
+import sklearn
+from sklearn.model_selection import train_test_split
+from sklearn.linear_model import LinearRegression
+from core.fileio import atomic_write
+
+DEFAULT_CHUNK_ROWS = 1 << 16
+
+def train_model(X, y):
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    model = LinearRegression()
+    model.fit(X_train, y_train)
+    return model
+
+
+class SufficientStatistics:
+    """
+    X^T X, X^T y, y^T y, sum(y) and the row count of a linear regression
+    problem (X carries a trailing column of ones for the intercept).
+    Statistics of disjoint chunks add up, so partial fits can be merged.
+    """
+    def __init__(self, n_features):
+        self.xtx = np.zeros((n_features + 1, n_features + 1))
+        self.xty = np.zeros(n_features + 1)
+        self.yty = 0.0
+        self.y_sum = 0.0
+        self.count = 0
+
+    def update(self, X, y):
+        design = np.empty((len(X), self.xtx.shape[0]))
+        design[:, :-1] = X
+        design[:, -1] = 1.0
+        self.xtx += design.T @ design
+        self.xty += design.T @ y
+        self.yty += float(y @ y)
+        self.y_sum += float(y.sum())
+        self.count += len(y)
+
+    def merge(self, other):
+        self.xtx += other.xtx
+        self.xty += other.xty
+        self.yty += other.yty
+        self.y_sum += other.y_sum
+        self.count += other.count
+
+    def residual_sum_of_squares(self, weights):
+        return float(self.yty - 2 * weights @ self.xty + weights @ self.xtx @ weights)
+
+    def to_dict(self):
+        return {"xtx": self.xtx.tolist(), "xty": self.xty.tolist(), "yty": self.yty,
+                "y_sum": self.y_sum, "count": self.count}
+
+    @classmethod
+    def from_dict(cls, data):
+        statistics = cls(len(data["xty"]) - 1)
+        statistics.xtx[...] = data["xtx"]
+        statistics.xty[...] = data["xty"]
+        statistics.yty = data["yty"]
+        statistics.y_sum = data["y_sum"]
+        statistics.count = data["count"]
+        return statistics
+
+
+class StreamingLinearRegression:
+    """
+    Linear regression fitted chunk by chunk through the normal equations.
+    Each chunk's rows are split between training and holdout statistics
+    as they arrive (with a generator seeded by `seed` and the chunk index,
+    so the split does not depend on which process fitted the chunk), and
+    holdout metrics are computed from those statistics without keeping
+    any rows. State can be saved and extended with new data later.
+    """
+    def __init__(self, n_features, holdout=0.2, fit_intercept=True, ridge=0.0, seed=42):
+        self.n_features = n_features
+        self.holdout = holdout
+        self.fit_intercept = fit_intercept
+        self.ridge = ridge
+        self.seed = seed
+        self.chunks_seen = 0
+        self.train = SufficientStatistics(n_features)
+        self.test = SufficientStatistics(n_features)
+        self._weights = None
+
+    def partial_fit(self, X, y, chunk_index=None):
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64).ravel()
+        if X.ndim != 2 or X.shape[1] != self.n_features or len(X) != len(y):
+            raise ValueError(f"Expected X of shape (n, {self.n_features}) and y of length n.")
+        if chunk_index is None:
+            chunk_index = self.chunks_seen
+        rng = np.random.default_rng([self.seed, chunk_index])
+        in_holdout = rng.random(len(y)) < self.holdout
+        self.train.update(X[~in_holdout], y[~in_holdout])
+        if in_holdout.any():
+            self.test.update(X[in_holdout], y[in_holdout])
+        self.chunks_seen += 1
+        self._weights = None
+        return self
+
+    def merge(self, other):
+        """Adds the statistics of a model fitted on other chunks."""
+        self.train.merge(other.train)
+        self.test.merge(other.test)
+        self.chunks_seen += other.chunks_seen
+        self._weights = None
+        return self
+
+    @property
+    def weights(self):
+        """Coefficients followed by the intercept, solved from the training statistics."""
+        if self._weights is None:
+            if self.train.count == 0:
+                raise RuntimeError("StreamingLinearRegression has not seen any training rows.")
+            size = self.n_features + (1 if self.fit_intercept else 0)
+            lhs = self.train.xtx[:size, :size] + self.ridge * np.eye(size)
+            rhs = self.train.xty[:size]
+            if self.fit_intercept and self.ridge:
+                lhs[-1, -1] -= self.ridge  # the intercept is not penalized
+            solution = np.linalg.lstsq(lhs, rhs, rcond=None)[0]
+            self._weights = np.zeros(self.n_features + 1)
+            self._weights[:size] = solution
+        return self._weights
+
+    @property
+    def coef_(self):
+        return self.weights[:-1]
+
+    @property
+    def intercept_(self):
+        return float(self.weights[-1])
+
+    def predict(self, X):
+        return np.asarray(X, dtype=np.float64) @ self.coef_ + self.intercept_
+
+    def holdout_mse(self):
+        return self.test.residual_sum_of_squares(self.weights) / self.test.count
+
+    def score(self):
+        """Holdout R^2, like LinearRegression.score on a held-out test set."""
+        total = self.test.yty - self.test.y_sum ** 2 / self.test.count
+        return 1.0 - self.test.residual_sum_of_squares(self.weights) / total
+
+    def save(self, filename: str):
+        """Writes the accumulated statistics (never the data) as JSON, atomically."""
+        state = {
+            "n_features": self.n_features, "holdout": self.holdout, "fit_intercept": self.fit_intercept,
+            "ridge": self.ridge, "seed": self.seed, "chunks_seen": self.chunks_seen,
+            "train": self.train.to_dict(), "test": self.test.to_dict(),
+        }
+        with atomic_write(filename, 'w') as f:
+            json.dump(state, f)
+
+    @classmethod
+    def load(cls, filename: str):
+        with open(filename, 'r') as f:
+            state = json.load(f)
+        model = cls(state["n_features"], holdout=state["holdout"], fit_intercept=state["fit_intercept"],
+                    ridge=state["ridge"], seed=state["seed"])
+        model.chunks_seen = state["chunks_seen"]
+        model.train = SufficientStatistics.from_dict(state["train"])
+        model.test = SufficientStatistics.from_dict(state["test"])
+        return model
+
+
+def iter_chunks(X, y, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """(X, y) row blocks of arrays or memmaps, e.g. the output of data_processing.ingest()."""
+    for start in range(0, len(X), chunk_rows):
+        yield X[start:start + chunk_rows], y[start:start + chunk_rows]
+
+
+def train_model_streaming(chunks, n_features, workers=1, model=None, **options):
+    """
+    Fits a StreamingLinearRegression on an iterable of (X, y) chunks. With
+    workers > 1 the chunks are fitted on a process pool (at most two per
+    worker in flight) and their statistics merged. Pass an existing
+    `model` to extend it with new data.
+    """
+    model = model or StreamingLinearRegression(n_features, **options)
+    if workers > 1:
+        params = {"holdout": model.holdout, "fit_intercept": model.fit_intercept,
+                  "ridge": model.ridge, "seed": model.seed}
+        offset = model.chunks_seen
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+            for i, (X, y) in enumerate(chunks):
+                if len(pending) >= 2 * workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        model.merge(future.result())
+                pending.add(executor.submit(_fit_chunk, (n_features, params, offset + i, X, y)))
+            for future in pending:
+                model.merge(future.result())
+        return model
+    for X, y in chunks:
+        model.partial_fit(X, y)
+    return model
+
+
+def _fit_chunk(task):
+    """Process-pool worker: statistics of a single chunk."""
+    n_features, params, chunk_index, X, y = task
+    return StreamingLinearRegression(n_features, **params).partial_fit(X, y, chunk_index)
@@ -0,0 +1,95 @@
+# mathematical_functions.py
+
+import hashlib
+from collections import OrderedDict
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import eigs, eigsh
+
+DECOMPOSITION_CACHE_SIZE = 32  # matrices whose decompositions are kept
+SYMMETRY_RTOL = 1e-12
+
+_DECOMPOSITIONS = OrderedDict()
+
+def calculate_eigenvalues(matrix):
+    eigenvalues = eigendecomposition(matrix)[0]
+    return eigenvalues
+
+def calculate_eigenvectors(matrix):
+    eigenvectors = eigendecomposition(matrix)[1]
+    return eigenvectors
+
+
+def _matrix_key(matrix):
+    """Content hash of a dense or sparse matrix, so equal matrices share a cache entry."""
+    digest = hashlib.blake2b(digest_size=20)
+    if sparse.issparse(matrix):
+        matrix = matrix.tocsr()
+        parts = (matrix.data, matrix.indices, matrix.indptr)
+    else:
+        parts = (np.ascontiguousarray(matrix),)
+    digest.update(repr((matrix.shape, str(matrix.dtype))).encode())
+    for part in parts:
+        digest.update(np.ascontiguousarray(part).data)
+    return digest.hexdigest()
+
+
+def _cached(key, compute):
+    if key in _DECOMPOSITIONS:
+        _DECOMPOSITIONS.move_to_end(key)
+        return _DECOMPOSITIONS[key]
+    result = compute()
+    for array in result:
+        array.flags.writeable = False  # shared between callers
+    _DECOMPOSITIONS[key] = result
+    if len(_DECOMPOSITIONS) > DECOMPOSITION_CACHE_SIZE:
+        _DECOMPOSITIONS.popitem(last=False)
+    return result
+
+
+def is_symmetric(matrix):
+    """True for (numerically) symmetric / Hermitian square matrices."""
+    if matrix.shape[0] != matrix.shape[1]:
+        return False
+    if sparse.issparse(matrix):
+        difference = abs(matrix - matrix.conj().T)
+        return difference.max() <= SYMMETRY_RTOL * abs(matrix).max()
+    return np.allclose(matrix, matrix.conj().T, rtol=SYMMETRY_RTOL, atol=0)
+
+
+def eigendecomposition(matrix):
+    """
+    (eigenvalues, eigenvectors) of a dense matrix, computed once per
+    distinct matrix and cached. Symmetric input uses eigh (real,
+    ascending eigenvalues); anything else falls back to eig.
+    """
+    matrix = np.asarray(matrix)
+    key = ("full", _matrix_key(matrix))
+    if is_symmetric(matrix):
+        return _cached(key, lambda: np.linalg.eigh(matrix))
+    return _cached(key, lambda: np.linalg.eig(matrix))
+
+
+def top_eigenpairs(matrix, k=6, which="LM"):
+    """
+    The k leading eigenpairs of a large dense or scipy.sparse matrix via
+    ARPACK: Lanczos (eigsh) for symmetric input, Arnoldi (eigs)
+    otherwise. Results are ordered by decreasing magnitude and cached
+    like eigendecomposition().
+    """
+    if not sparse.issparse(matrix):
+        matrix = np.asarray(matrix)
+    if not 0 < k < matrix.shape[0] - 1:
+        raise ValueError(f"k must be between 1 and n - 2 for ARPACK, got k={k} with n={matrix.shape[0]}.")
+
+    def compute():
+        solver = eigsh if is_symmetric(matrix) else eigs
+        values, vectors = solver(matrix, k=k, which=which)
+        order = np.argsort(-np.abs(values), kind="stable")
+        return values[order], vectors[:, order]
+
+    return _cached(("top", k, which, _matrix_key(matrix)), compute)
+
+
+def clear_cache():
+    _DECOMPOSITIONS.clear()
@@ -0,0 +1,90 @@
+# natural_language_processing.py
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+import nltk
+from nltk.tokenize import word_tokenize
+from perf.profiling import profiled
+
+DEFAULT_LEMMA_CACHE = 1 << 16  # distinct tokens remembered per pipeline
+DEFAULT_BATCH_SIZE = 256  # documents per process-pool task
+
+def tokenize_text(text):
+    tokens = word_tokenize(text)
+    return tokens
+
+def remove_stopwords(tokens):
+    stopwords = _default_pipeline().stopwords
+    filtered_tokens = [token for token in tokens if token not in stopwords]
+    return filtered_tokens
+
+def lemmatize_tokens(tokens):
+    lemmatize = _default_pipeline().lemmatize
+    lemmatized_tokens = [lemmatize(token) for token in tokens]
+    return lemmatized_tokens
+
+
+class TextPipeline:
+    """
+    tokenize -> remove stopwords -> lemmatize, with the stopword list and
+    the WordNet lemmatizer loaded once. Stopwords are a frozenset, and
+    lemmas are memoized in a bounded LRU cache, so repeated tokens are
+    only lemmatized once.
+    """
+    def __init__(self, language="english", lemma_cache_size=DEFAULT_LEMMA_CACHE):
+        self.language = language
+        self.lemma_cache_size = lemma_cache_size
+        self.stopwords = frozenset(nltk.corpus.stopwords.words(language))
+        self.lemmatizer = nltk.stem.WordNetLemmatizer()
+        self.lemmatize = lru_cache(maxsize=lemma_cache_size)(self.lemmatizer.lemmatize)
+
+    def process(self, text):
+        stopwords = self.stopwords
+        lemmatize = self.lemmatize
+        return [lemmatize(token) for token in word_tokenize(text) if token not in stopwords]
+
+    @profiled()
+    def stream(self, documents):
+        """Lazily yields the processed tokens of each document."""
+        for text in documents:
+            yield self.process(text)
+
+    def stream_parallel(self, documents, workers=None, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        stream() on a process pool: documents are sent in batches of
+        `batch_size`, each worker builds its own pipeline once, and results
+        come back in input order. At most two batches per worker are in
+        flight, so arbitrarily long iterables are consumed lazily.
+        """
+        documents = iter(documents)
+        workers = workers or os.cpu_count()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.language, self.lemma_cache_size)) as executor:
+            pending = deque()
+            while True:
+                while len(pending) < 2 * workers:
+                    batch = list(islice(documents, batch_size))
+                    if not batch:
+                        break
+                    pending.append(executor.submit(_process_batch, batch))
+                if not pending:
+                    return
+                yield from pending.popleft().result()
+
+
+@lru_cache(maxsize=None)
+def _default_pipeline():
+    return TextPipeline()
+
+
+_WORKER_PIPELINE = None
+
+def _init_worker(language, lemma_cache_size):
+    global _WORKER_PIPELINE
+    _WORKER_PIPELINE = TextPipeline(language, lemma_cache_size)
+
+
+def _process_batch(batch):
+    return [_WORKER_PIPELINE.process(text) for text in batch]
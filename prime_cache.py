@@ -0,0 +1,64 @@
+import os
+import re
+import numpy as np
+from ai.prime_sieve import prime_gaps
+from core.fileio import atomic_write
+
+ENTRY_PATTERN = re.compile(r"^primes-(\d+)-(\d+)\.npy$")
+
+class PrimeCache:
+    """
+    On-disk cache of primes and raw gaps, one pair of flat .npy files per
+    sieved range [start, stop). Files are opened with np.memmap semantics,
+    so every process reading the cache shares the same pages and no copy
+    is made; a sub-range of a larger cached range is served as a view
+    located by binary search.
+    """
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, kind: str, start: int, stop: int) -> str:
+        return os.path.join(self.directory, f"{kind}-{start}-{stop}.npy")
+
+    def entries(self) -> list:
+        """Cached (start, stop) ranges, smallest first."""
+        found = []
+        for name in os.listdir(self.directory):
+            match = ENTRY_PATTERN.match(name)
+            if match:
+                found.append((int(match.group(1)), int(match.group(2))))
+        return sorted(found, key=lambda r: (r[1] - r[0], r[0]))
+
+    def lookup(self, start: int, stop: int):
+        """
+        Returns read-only (primes, gaps) views for [start, stop), or None
+        when no cached range covers it.
+        """
+        for lo, hi in self.entries():
+            if lo <= start and stop <= hi:
+                primes = np.load(self._path("primes", lo, hi), mmap_mode='r')
+                gaps = np.load(self._path("gaps", lo, hi), mmap_mode='r')
+                first = int(np.searchsorted(primes, start))
+                last = int(np.searchsorted(primes, stop))
+                return primes[first:last], gaps[first:max(first, last - 1)]
+        return None
+
+    def _write(self, path: str, array: np.ndarray):
+        # Write-then-rename so concurrent readers never see a partial file.
+        with atomic_write(path) as f:
+            np.save(f, array)
+
+    def store(self, start: int, stop: int, primes: np.ndarray):
+        """Persists primes (and their gaps) for [start, stop) and returns memmapped views."""
+        # Gaps first: an entry is only discoverable once its primes file exists.
+        self._write(self._path("gaps", start, stop), prime_gaps(primes))
+        self._write(self._path("primes", start, stop), primes)
+        return self.lookup(start, stop)
+
+    def load(self, start: int, stop: int, compute):
+        """lookup(), falling back to compute(start, stop) and storing the result."""
+        cached = self.lookup(start, stop)
+        if cached is not None:
+            return cached
+        return self.store(start, stop, compute(start, stop))
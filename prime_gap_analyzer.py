@@ -1,30 +1,185 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 from sympy import primerange
 from scipy.fftpack import fft
-from core.golden_ratio import phi_scale, phi_harmonic_series
+from core.golden_ratio import phi_scale, phi_harmonic_series, phi_harmonic_array
+from ai.prime_sieve import (
+    DEFAULT_SEGMENT_SIZE, sieve_primes, prime_gaps, phi_scaled_gaps, gap_ratios, iter_gap_blocks,
+    parallel_sieve_primes, preceding_primes, split_range
+)
+from ai.gap_statistics import GapStatistics
+from ai.prime_cache import PrimeCache
+from core.fileio import atomic_write
+from perf.profiling import profiled
+
+BACKENDS = ("sympy", "sieve")
 
 class PrimeGapAnalyzer:
     """
     Includes references to advanced math breakthroughs:
     Riemann Hypothesis, Navier–Stokes, etc. for scenario generation.
+
+    backend="sympy" keeps the original list-based path; backend="sieve"
+    uses the segmented NumPy sieve and stores primes, gaps and ratios
+    as typed arrays.
+
+    streaming=True computes nothing up front: gap blocks are produced by
+    stream_gap_blocks() from the sieve and only running statistics are kept.
+
+    workers > 1 sieves disjoint intervals on a process pool (workers=None
+    uses every core); results are merged in interval order and are
+    identical to a serial run.
+
+    cache_dir enables a PrimeCache for the sieve backend: primes and gaps
+    are read back as memory-mapped arrays instead of being sieved again.
     """
-    def __init__(self, prime_limit=1000):
+    def __init__(self, prime_limit=1000, backend="sympy", segment_size=DEFAULT_SEGMENT_SIZE,
+                 streaming=False, workers=1, cache_dir=None):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}.")
         self.prime_limit = prime_limit
+        self.backend = backend
+        self.segment_size = segment_size
+        self.streaming = streaming
+        self.workers = workers or os.cpu_count()
+        self.cache = PrimeCache(cache_dir) if cache_dir else None
+        self._cached_gaps = None
+        self.wave_patterns = None
+        if streaming:
+            self.primes = self.prime_gaps = self.gap_ratios = None
+            self.statistics = GapStatistics()
+            self.scanned_limit = 2
+            self.last_prime = None
+            self.last_gap = None
+            return
         self.primes = self.generate_primes()
         self.prime_gaps = self.calculate_prime_gaps()
         self.gap_ratios = self.calculate_gap_ratios()
-        self.wave_patterns = None
 
+    @profiled()
     def generate_primes(self):
+        if self.backend == "sieve":
+            if self.cache is not None:
+                primes, self._cached_gaps = self.cache.load(2, self.prime_limit, self._sieve)
+                return primes
+            return self._sieve(2, self.prime_limit)
         return list(primerange(2, self.prime_limit))
 
+    def _sieve(self, start, stop):
+        if self.workers > 1:
+            return parallel_sieve_primes(start, stop, self.workers, self.segment_size)
+        return sieve_primes(start, stop, self.segment_size)
+
+    @profiled()
     def calculate_prime_gaps(self):
+        if isinstance(self.primes, np.ndarray):
+            if self._cached_gaps is not None:
+                return phi_scaled_gaps(self._cached_gaps)
+            return phi_scaled_gaps(prime_gaps(self.primes))
         gaps = [self.primes[i+1] - self.primes[i] for i in range(len(self.primes)-1)]
         return [phi_scale(gap) for gap in gaps]
 
     def calculate_gap_ratios(self):
+        if isinstance(self.prime_gaps, np.ndarray):
+            return gap_ratios(self.prime_gaps)
         return [self.prime_gaps[i+1]/self.prime_gaps[i] for i in range(len(self.prime_gaps)-1)]
 
     def detect_wave_patterns(self):
         self.wave_patterns = np.abs(fft(self.prime_gaps))
-        return phi_harmonic_series(len(self.wave_patterns))
\ No newline at end of file
+        if isinstance(self.prime_gaps, np.ndarray):
+            return phi_harmonic_array(len(self.wave_patterns))
+        return phi_harmonic_series(len(self.wave_patterns))
+
+    def stream_gap_blocks(self):
+        """
+        Yields phi-scaled gap blocks for [scanned_limit, prime_limit), one
+        sieve segment at a time, updating self.statistics as it goes.
+        """
+        if not self.streaming:
+            raise RuntimeError("stream_gap_blocks() requires streaming=True.")
+        blocks = iter_gap_blocks(self.scanned_limit, self.prime_limit, self.segment_size, self.last_prime)
+        for hi, raw_gaps, last_prime in blocks:
+            scaled = phi_scaled_gaps(raw_gaps)
+            if self.last_gap is not None and len(scaled):
+                ratios = scaled / np.concatenate(([self.last_gap], scaled[:-1]))
+            else:
+                ratios = gap_ratios(scaled)
+            self.statistics.update(raw_gaps, ratios)
+            self.scanned_limit = hi
+            self.last_prime = last_prime
+            if len(scaled):
+                self.last_gap = float(scaled[-1])
+            yield scaled
+
+    @profiled()
+    def run_stream(self):
+        """
+        Drains stream_gap_blocks() and returns the statistics summary.
+        With workers > 1 the remaining range is scanned in parallel instead.
+        """
+        if self.workers > 1:
+            self._run_parallel_stream()
+        for _ in self.stream_gap_blocks():
+            pass
+        return self.statistics.summary()
+
+    def _run_parallel_stream(self):
+        intervals = split_range(self.scanned_limit, self.prime_limit, self.workers * 4, self.segment_size)
+        if len(intervals) <= 1:
+            return
+        # The first interval continues from this analyzer's own state; the
+        # others seed theirs from the primes just below their lower bound.
+        head = (intervals[0][0], intervals[0][1], self.segment_size, self.last_prime, self.last_gap)
+        tasks = [head] + [(lo, hi, self.segment_size, None, None) for lo, hi in intervals[1:]]
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for statistics, last_prime, last_gap in executor.map(_scan_interval, tasks):
+                self.statistics.merge(statistics)
+                self.last_prime = last_prime if last_prime is not None else self.last_prime
+                self.last_gap = last_gap if last_gap is not None else self.last_gap
+        self.scanned_limit = self.prime_limit
+
+    def save_checkpoint(self, filename: str):
+        """Writes the streaming state atomically so a later run can extend the scan."""
+        with atomic_write(filename, 'w') as f:
+            json.dump({
+                "scanned_limit": self.scanned_limit,
+                "last_prime": self.last_prime,
+                "last_gap": self.last_gap,
+                "segment_size": self.segment_size,
+                "statistics": self.statistics.to_dict(),
+            }, f, indent=2)
+
+    @classmethod
+    def from_checkpoint(cls, filename: str, prime_limit: int):
+        """
+        Resumes a streaming scan saved by save_checkpoint(). Only
+        [scanned_limit, prime_limit) is sieved by the next stream.
+        """
+        with open(filename, 'r') as f:
+            state = json.load(f)
+        analyzer = cls(prime_limit=prime_limit, backend="sieve",
+                       segment_size=state["segment_size"], streaming=True)
+        analyzer.scanned_limit = state["scanned_limit"]
+        analyzer.last_prime = state["last_prime"]
+        analyzer.last_gap = state["last_gap"]
+        analyzer.statistics = GapStatistics.from_dict(state["statistics"])
+        return analyzer
+
+
+def _scan_interval(task):
+    """Process-pool worker: streams [lo, hi) and returns its statistics."""
+    lo, hi, segment_size, last_prime, last_gap = task
+    analyzer = PrimeGapAnalyzer(prime_limit=hi, backend="sieve", segment_size=segment_size, streaming=True)
+    analyzer.scanned_limit = lo
+    if last_prime is None:
+        previous = preceding_primes(lo, 2)
+        if previous:
+            last_prime = previous[-1]
+        if len(previous) == 2:
+            last_gap = phi_scale(previous[1] - previous[0])
+    analyzer.last_prime = last_prime
+    analyzer.last_gap = last_gap
+    analyzer.run_stream()
+    return analyzer.statistics, analyzer.last_prime, analyzer.last_gap
@@ -1,26 +1,52 @@
+import os
 import matplotlib.pyplot as plt
 import numpy as np
 from core.golden_ratio import PHI
+from visualization.rendering import (
+    DEFAULT_LINE_POINTS, MARKER_LIMIT, minmax_downsample, render_with_budget, save_figure
+)
 
 class PrimeGapVisualizer:
+    """
+    Series longer than `max_points` are min/max-downsampled before
+    plotting (spikes are kept), and per-point markers are dropped for long
+    series. With `path` the figures are exported headlessly to
+    <path stem>_gaps<ext> and <path stem>_ratios<ext> instead of shown;
+    `budget` (seconds per figure) then picks the point count.
+    """
     @staticmethod
-    def visualize(prime_gaps, gap_ratios):
-        plt.figure(figsize=(12, 6))
-        plt.plot(prime_gaps, label="Prime Gaps", marker="o", color="blue")
-        plt.axhline(y=np.mean(prime_gaps), color="red", linestyle="--", label="Mean Gap")
+    def _figure(values, max_points, label, marker, color, title, ylabel, mean=None):
+        x, y = minmax_downsample(values, max_points)
+        fig = plt.figure(figsize=(12, 6))
+        plt.plot(x, y, label=label, marker=marker if len(y) <= MARKER_LIMIT else None, color=color)
+        if mean is not None:
+            plt.axhline(y=mean, color="red", linestyle="--", label="Mean Gap")
         plt.axhline(y=PHI, color="gold", linestyle="--", label="Golden Ratio")
-        plt.title("Prime Gaps Visualization")
+        plt.title(title)
         plt.xlabel("Index")
-        plt.ylabel("Gap Size")
+        plt.ylabel(ylabel)
         plt.legend()
         plt.grid()
+        return fig
 
-        plt.figure(figsize=(12, 6))
-        plt.plot(gap_ratios, label="Gap Ratios", marker="x", color="green")
-        plt.axhline(y=PHI, color="gold", linestyle="--", label="Golden Ratio")
-        plt.title("Prime Gap Ratios")
-        plt.xlabel("Index")
-        plt.ylabel("Ratio")
-        plt.legend()
-        plt.grid()
-        plt.show()
\ No newline at end of file
+    @staticmethod
+    def visualize(prime_gaps, gap_ratios, max_points=DEFAULT_LINE_POINTS, path=None, budget=None):
+        figures = {
+            "gaps": lambda n: PrimeGapVisualizer._figure(
+                prime_gaps, n, "Prime Gaps", "o", "blue", "Prime Gaps Visualization", "Gap Size",
+                mean=np.mean(prime_gaps)),
+            "ratios": lambda n: PrimeGapVisualizer._figure(
+                gap_ratios, n, "Gap Ratios", "x", "green", "Prime Gap Ratios", "Ratio"),
+        }
+        if path is None:
+            for build in figures.values():
+                build(max_points)
+            plt.show()
+            return
+        root, ext = os.path.splitext(path)
+        for name, build in figures.items():
+            target = f"{root}_{name}{ext}"
+            if budget is None:
+                save_figure(build(max_points), target)
+            else:
+                render_with_budget(build, target, budget, max_points)
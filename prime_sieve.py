@@ -0,0 +1,177 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import numpy as np
+from core.golden_ratio import phi_scale
+
+DEFAULT_SEGMENT_SIZE = 1 << 21  # integers covered per sieve segment
+UINT32_LIMIT = 1 << 32
+
+
+def prime_dtype(stop: int):
+    """Smallest unsigned dtype able to hold every prime below `stop`."""
+    return np.uint32 if stop <= UINT32_LIMIT else np.uint64
+
+
+def base_primes(limit: int) -> np.ndarray:
+    """Plain sieve of Eratosthenes for all primes <= limit (used as sieving primes)."""
+    if limit < 2:
+        return np.zeros(0, dtype=np.uint64)
+    is_prime = np.ones(limit + 1, dtype=bool)
+    is_prime[:2] = False
+    for p in range(2, math.isqrt(limit) + 1):
+        if is_prime[p]:
+            is_prime[p * p::p] = False
+    return np.flatnonzero(is_prime).astype(np.uint64)
+
+
+def _sieve_segment(lo: int, hi: int, sieving_primes) -> np.ndarray:
+    """
+    Odd-only sieve of [lo, hi). Each slot of the working array stands for
+    one odd integer, so a segment costs (hi - lo) / 2 bytes.
+    """
+    first = lo | 1
+    count = (hi - first + 1) // 2
+    if count <= 0:
+        return np.array([2] if lo <= 2 < hi else [], dtype=np.uint64)
+    is_prime = np.ones(count, dtype=bool)
+    if first == 1:
+        is_prime[0] = False
+    for p in sieving_primes:
+        if p * p >= hi:
+            break
+        start = max(p * p, -(-first // p) * p)
+        if start % 2 == 0:
+            start += p
+        is_prime[(start - first) // 2::p] = False
+    primes = np.flatnonzero(is_prime).astype(np.uint64)
+    primes *= 2
+    primes += first
+    if lo <= 2 < hi:
+        primes = np.concatenate((np.array([2], dtype=np.uint64), primes))
+    return primes
+
+
+def _iter_segments(start: int, stop: int, segment_size: int):
+    """Yields (lo, hi, primes) for consecutive segments covering [start, stop)."""
+    if segment_size < 2:
+        raise ValueError("segment_size must be at least 2.")
+    start = max(start, 2)
+    if stop <= start:
+        return
+    dtype = prime_dtype(stop)
+    sieving_primes = [int(p) for p in base_primes(math.isqrt(stop - 1))[1:]]
+    for lo in range(start, stop, segment_size):
+        hi = min(lo + segment_size, stop)
+        yield lo, hi, _sieve_segment(lo, hi, sieving_primes).astype(dtype, copy=False)
+
+
+def iter_prime_segments(start: int, stop: int, segment_size: int = DEFAULT_SEGMENT_SIZE):
+    """
+    Yields the primes in [start, stop) one segment at a time.
+    Working memory is bounded by `segment_size`, not by `stop`.
+    """
+    for _, _, primes in _iter_segments(start, stop, segment_size):
+        yield primes
+
+
+def iter_gap_blocks(start: int, stop: int, segment_size: int = DEFAULT_SEGMENT_SIZE, last_prime=None):
+    """
+    Yields (hi, raw_gaps, last_prime) per segment of [start, stop).
+    Gaps that straddle a segment boundary are stitched using the last prime
+    of the previous segment; pass `last_prime` to continue an earlier scan
+    that stopped at `start`.
+    """
+    for _, hi, primes in _iter_segments(start, stop, segment_size):
+        if len(primes) == 0:
+            yield hi, np.zeros(0, dtype=np.uint32), last_prime
+            continue
+        if last_prime is not None:
+            gaps = np.empty(len(primes), dtype=np.uint32)
+            gaps[0] = int(primes[0]) - last_prime
+            gaps[1:] = np.diff(primes)
+        else:
+            gaps = prime_gaps(primes)
+        last_prime = int(primes[-1])
+        yield hi, gaps, last_prime
+
+
+def sieve_primes(start: int, stop: int, segment_size: int = DEFAULT_SEGMENT_SIZE) -> np.ndarray:
+    """All primes in [start, stop) as a uint32/uint64 array."""
+    segments = list(iter_prime_segments(start, stop, segment_size))
+    if not segments:
+        return np.zeros(0, dtype=prime_dtype(stop))
+    return np.concatenate(segments)
+
+
+def preceding_primes(n: int, count: int = 2) -> list:
+    """Up to `count` largest primes below n, in ascending order."""
+    window = 2048
+    while True:
+        lo = max(2, n - window)
+        found = sieve_primes(lo, n)
+        if len(found) >= count or lo == 2:
+            return [int(p) for p in found[-count:]] if len(found) else []
+        window *= 2
+
+
+def split_range(start: int, stop: int, parts: int, align: int = 1) -> list:
+    """
+    Splits [start, stop) into at most `parts` disjoint, ordered intervals
+    whose inner boundaries are multiples of `align`.
+    """
+    start = max(start, 2)
+    if stop <= start:
+        return []
+    step = -(-(stop - start) // max(parts, 1))
+    step = max(align, -(-step // align) * align)
+    bounds = list(range(start, stop, step)) + [stop]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _sieve_interval(bounds) -> np.ndarray:
+    lo, hi, segment_size = bounds
+    return sieve_primes(lo, hi, segment_size)
+
+
+def parallel_sieve_primes(start: int, stop: int, workers: int,
+                          segment_size: int = DEFAULT_SEGMENT_SIZE) -> np.ndarray:
+    """
+    sieve_primes() over a process pool. Intervals are disjoint and collected
+    in order, so the result is identical to the serial sieve.
+    """
+    intervals = split_range(start, stop, workers * 4, segment_size)
+    if len(intervals) <= 1:
+        return sieve_primes(start, stop, segment_size)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        segments = list(executor.map(_sieve_interval, [(lo, hi, segment_size) for lo, hi in intervals]))
+    return np.concatenate(segments).astype(prime_dtype(stop), copy=False)
+
+
+def prime_gaps(primes: np.ndarray) -> np.ndarray:
+    """Raw gaps between consecutive primes as uint32."""
+    return np.diff(primes).astype(np.uint32, copy=False)
+
+
+@lru_cache(maxsize=16)
+def _phi_gap_table(size: int, factor: float) -> np.ndarray:
+    table = np.array([phi_scale(g, factor) for g in range(size)], dtype=np.float64)
+    table.flags.writeable = False
+    return table
+
+
+def phi_scaled_gaps(gaps: np.ndarray, factor: float = 1.0) -> np.ndarray:
+    """
+    Applies phi_scale to a whole gap array at once. Gaps are small integers,
+    so every distinct value is scaled once through a cached lookup table and
+    the result is bit-identical to calling phi_scale per element.
+    """
+    if len(gaps) == 0:
+        return np.zeros(0, dtype=np.float64)
+    size = 1 << int(gaps.max()).bit_length()
+    return _phi_gap_table(size, factor)[gaps]
+
+
+def gap_ratios(scaled_gaps: np.ndarray) -> np.ndarray:
+    """Ratios between consecutive (scaled) gaps as float64."""
+    return scaled_gaps[1:] / scaled_gaps[:-1]
@@ -0,0 +1,136 @@
+import functools
+import inspect
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+ENV_FLAG = "ETERNAFX_PROFILE"  # "1" records timings, "trace" also records allocation peaks
+
+_mode = {"": None, "0": None, "trace": "trace"}.get(os.environ.get(ENV_FLAG, ""), "time")
+_lock = threading.Lock()
+_sinks = []
+METRICS = {}
+
+
+def enable(trace=False):
+    """Turns stage metrics on; trace=True also tracks tracemalloc peaks."""
+    global _mode
+    _mode = "trace" if trace else "time"
+
+
+def disable():
+    global _mode
+    _mode = None
+
+
+def is_enabled():
+    return _mode is not None
+
+
+def add_sink(sink):
+    """Registers sink(stage, record), called after every profiled call (e.g. to forward to a metrics backend)."""
+    _sinks.append(sink)
+
+
+def remove_sink(sink):
+    _sinks.remove(sink)
+
+
+def reset():
+    with _lock:
+        METRICS.clear()
+
+
+def snapshot():
+    """Copy of the per-stage totals: calls, total/max seconds and the largest allocation peak."""
+    with _lock:
+        return {stage: dict(metrics) for stage, metrics in METRICS.items()}
+
+
+def _record(stage, elapsed, peak):
+    record = {"seconds": elapsed, "peak_alloc": peak}
+    with _lock:
+        metrics = METRICS.setdefault(stage, {"calls": 0, "total_seconds": 0.0, "max_seconds": 0.0,
+                                             "peak_alloc": None})
+        metrics["calls"] += 1
+        metrics["total_seconds"] += elapsed
+        metrics["max_seconds"] = max(metrics["max_seconds"], elapsed)
+        if peak is not None:
+            metrics["peak_alloc"] = max(metrics["peak_alloc"] or 0, peak)
+    for sink in _sinks:
+        sink(stage, record)
+
+
+class _Probe:
+    """
+    Times one stage. Nested traced stages share the outermost tracemalloc
+    session, so an inner peak may include allocations its caller made first.
+    """
+    def __init__(self):
+        self.tracing = _mode == "trace"
+        self.owns_trace = False
+        if self.tracing and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.owns_trace = True
+        if self.tracing:
+            self.base = tracemalloc.get_traced_memory()[0]
+        self.start = time.perf_counter()
+
+    def finish(self, stage):
+        elapsed = time.perf_counter() - self.start
+        peak = None
+        if self.tracing and tracemalloc.is_tracing():
+            peak = max(tracemalloc.get_traced_memory()[1] - self.base, 0)
+            if self.owns_trace:
+                tracemalloc.stop()
+        _record(stage, elapsed, peak)
+
+
+@contextmanager
+def stage(name):
+    """Profiles a block of code under `name`; free when profiling is off."""
+    if _mode is None:
+        yield
+        return
+    probe = _Probe()
+    try:
+        yield
+    finally:
+        probe.finish(name)
+
+
+def profiled(name=None):
+    """
+    Decorator emitting per-call metrics under `name` (default: the
+    function's qualified name). When profiling is off the wrapper only
+    checks a module flag. Generator functions are measured from the first
+    to the last item (consumer time included), not just the call that
+    creates them.
+    """
+    def decorate(func):
+        label = name or f"{func.__module__}.{func.__qualname__}"
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def generator_wrapper(*args, **kwargs):
+                if _mode is None:
+                    return (yield from func(*args, **kwargs))
+                probe = _Probe()
+                try:
+                    return (yield from func(*args, **kwargs))
+                finally:
+                    probe.finish(label)
+            return generator_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _mode is None:
+                return func(*args, **kwargs)
+            probe = _Probe()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                probe.finish(label)
+        return wrapper
+    return decorate
@@ -2,7 +2,7 @@
 EternaFX_Full_Script.py
 
 A single-file demonstration of the EternaFX Framework that integrates:
-- HPC PDE synergy (Navier–Stokes placeholder)
+- HPC PDE synergy (Navier–Stokes projection solver)
 - AI modules: scenario generation, complexity (P vs NP)
 - Number-theoretic expansions: Riemann Hypothesis, BSD
 - References to Hilbert Problems and Millennium Problems
@@ -22,36 +22,43 @@ This script prints a synergy run, highlighting each domain:
 """
 
 # ---------------------------
-# 1. HPC PDE MODULE (Navier-Stokes Stub)
+# 1. HPC PDE MODULE (Navier-Stokes)
 # ---------------------------
 
+import os
+from navier_stokes import IncompressibleFlow, taylor_green
+from lattice_gauge import LatticeGauge
+
 class NavierStokesSolver:
     """
-    A placeholder HPC PDE approach for 3D Navier–Stokes.
-    In real usage, you'd rely on Fenics or other HPC frameworks.
+    Incompressible Navier–Stokes on a periodic 2D/3D grid, backed by the
+    NumPy projection solver in navier_stokes.py (Taylor–Green initial flow).
     Ties to:
         - Millennium Problem #2: Navier–Stokes existence & smoothness
         - Theoretical physics: fluid dynamics, turbulence, MHD flows
         - Hilbert #20 (general boundary value problems)
     """
 
-    def __init__(self, viscosity=1e-3, density=1000.0):
+    def __init__(self, viscosity=1e-3, density=1000.0, shape=(64, 64), workers=1):
         self.viscosity = viscosity
         self.density = density
+        self.flow = IncompressibleFlow(shape, viscosity=viscosity, density=density,
+                                       velocity=taylor_green(shape), workers=workers)
 
     def run_simulation(self, steps=5):
         """
-        Stub function simulating HPC PDE steps, referencing
+        Advances the flow `steps` time steps, referencing
         the potential blow-up or singularities relevant to the Millennium problem.
 
         Return:
-            velocity_stub (str), pressure_stub (str)
-            Real HPC code would produce arrays or function objects.
+            velocity (dim, *shape) array, pressure (*shape) array
         """
-        print("[NavierStokesSolver] Running Navier-Stokes simulation (stub).")
+        print(f"[NavierStokesSolver] Running Navier-Stokes simulation on a {self.flow.shape} grid.")
         for step in range(1, steps + 1):
-            print(f"  Step {step}... (computing fluid flow, HPC PDE approach)")
-        return "velocity_field_stub", "pressure_field_stub"
+            dt = self.flow.step()
+            print(f"  Step {step}... t={self.flow.time:.4f}, dt={dt:.2e}, "
+                  f"kinetic energy={self.flow.kinetic_energy():.6f}")
+        return self.flow.interior_velocity, self.flow.pressure
 
 
 # ---------------------------
@@ -130,17 +137,32 @@ class BSDModule:
 class YangMillsModule:
     """
     Yang–Mills & Mass Gap (Millennium #4).
-    HPC approach often uses lattice gauge theory (Monte Carlo).
+    HPC approach often uses lattice gauge theory (Monte Carlo), here via
+    the checkerboard Metropolis engine in lattice_gauge.py.
     Confinement resonates with strong interaction QCD in physics.
     """
 
-    def run_yang_mills_lattice(self):
+    def __init__(self, size=8, dims=4, group="SU2", beta=2.3, checkpoint=None, seed=None):
+        self.checkpoint = checkpoint
+        if checkpoint and os.path.exists(checkpoint):
+            self.lattice = LatticeGauge.from_checkpoint(checkpoint)
+        else:
+            self.lattice = LatticeGauge(size=size, dims=dims, group=group, beta=beta, seed=seed)
+
+    def run_yang_mills_lattice(self, sweeps=5):
         """
-        Stub referencing HPC-based lattice approach.
-        Real code might do a 4D or 3D gauge lattice update.
+        Runs `sweeps` Monte Carlo sweeps of the gauge lattice, resuming
+        from (and writing to) the checkpoint file when one is set.
+
+        Return:
+            links array of the current gauge configuration
         """
-        print("[YangMillsModule] HPC-based lattice simulation for mass gap (stub).")
-        return "gauge_configuration_stub"
+        lattice = self.lattice
+        print(f"[YangMillsModule] {lattice.group} lattice {lattice.size}^{lattice.dims}, beta={lattice.beta}.")
+        for record in lattice.run(sweeps, checkpoint=self.checkpoint):
+            print(f"  Sweep {record['sweep']}... plaquette={record['plaquette']:.4f}, "
+                  f"acceptance={record['acceptance']:.2f}")
+        return lattice.links
 
 
 class HodgeModule:
@@ -195,8 +217,8 @@ def eternafx_full_synergy():
 
     # HPC PDE: Navier–Stokes
     pde_solver = NavierStokesSolver(viscosity=1e-3, density=1000.0)
-    velocity_stub, pressure_stub = pde_solver.run_simulation(steps=3)
-    print("[Synergy] PDE output:", velocity_stub, pressure_stub, "\n")
+    velocity, pressure = pde_solver.run_simulation(steps=3)
+    print("[Synergy] PDE output: velocity", velocity.shape, "pressure", pressure.shape, "\n")
 
     # AI Complexity: P vs NP
     complexity_ai = ComplexityModule()
@@ -219,9 +241,9 @@ def eternafx_full_synergy():
     print()
 
     # Yang–Mills HPC
-    yang_mills = YangMillsModule()
-    gauge_conf = yang_mills.run_yang_mills_lattice()
-    print("[Synergy] Yang–Mills gauge conf:", gauge_conf, "\n")
+    yang_mills = YangMillsModule(size=4)
+    gauge_conf = yang_mills.run_yang_mills_lattice(sweeps=3)
+    print("[Synergy] Yang–Mills gauge conf:", gauge_conf.shape, "\n")
 
     # Hodge Conjecture
     hodge_mod = HodgeModule()
@@ -0,0 +1,167 @@
+import time
+import numpy as np
+
+DEFAULT_LINE_POINTS = 4000  # about two samples per horizontal pixel of a wide figure
+DEFAULT_CLOUD_POINTS = 20000
+DEFAULT_SURFACE_SIZE = 200  # samples per surface axis
+MARKER_LIMIT = 500  # per-point markers are only drawn for series at most this long
+PROBE_POINTS = 1000  # size of the timing render used by render_with_budget()
+
+
+def minmax_downsample(y, max_points=DEFAULT_LINE_POINTS, x=None):
+    """
+    Reduces a line series to at most `max_points` points by keeping the
+    minimum and maximum of each bucket in their original order, so every
+    spike survives. Buckets that are entirely NaN are dropped. Returns (x, y).
+    """
+    y = np.asarray(y)
+    n = len(y)
+    x = np.arange(n) if x is None else np.asarray(x)
+    if n <= max_points:
+        return x, y
+    size = -(-n // max(max_points // 2, 1))
+    buckets = -(-n // size)
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = y
+    blocks = padded.reshape(buckets, size)
+    valid = ~np.isnan(blocks).all(axis=1)  # all-NaN buckets (gaps in the data) keep no points
+    blocks = blocks[valid]
+    low, high = np.nanargmin(blocks, axis=1), np.nanargmax(blocks, axis=1)
+    offsets = np.flatnonzero(valid)[:, None] * size
+    index = (np.sort(np.stack([low, high], axis=1), axis=1) + offsets).ravel()
+    index = np.unique(index)
+    return x[index], y[index]
+
+
+def lttb_downsample(y, max_points=DEFAULT_LINE_POINTS, x=None):
+    """
+    Largest-Triangle-Three-Buckets: keeps the first and last points and,
+    per bucket, the point forming the largest triangle with the previous
+    pick and the next bucket's mean. Returns (x, y).
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    x = np.arange(n, dtype=np.float64) if x is None else np.asarray(x, dtype=np.float64)
+    if n <= max_points or max_points < 3:
+        return x, y
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+    index = np.empty(max_points, dtype=np.intp)
+    index[0], index[-1] = 0, n - 1
+    previous = 0
+    for b in range(max_points - 2):
+        lo, hi = edges[b], edges[b + 1]
+        next_hi = edges[b + 2] if b + 2 < len(edges) else n
+        mean_x, mean_y = x[hi:next_hi].mean(), y[hi:next_hi].mean()
+        area = np.abs((x[previous] - mean_x) * (y[lo:hi] - y[previous])
+                      - (x[previous] - x[lo:hi]) * (mean_y - y[previous]))
+        previous = lo + int(np.argmax(area))
+        index[b + 1] = previous
+    return x[index], y[index]
+
+
+def decimate_points(points, max_points=DEFAULT_CLOUD_POINTS, method="voxel", seed=0):
+    """
+    Reduces an (n, 3) point cloud to at most `max_points` points.
+    method="voxel" keeps one point per cell of the finest regular grid
+    that stays within the limit (even coverage of the surface);
+    method="random" keeps a uniform random subset.
+    """
+    points = np.asarray(points)
+    n = len(points)
+    if n <= max_points:
+        return points
+    if method == "random":
+        keep = np.random.default_rng(seed).choice(n, max_points, replace=False)
+        return points[np.sort(keep)]
+    if method != "voxel":
+        raise ValueError(f"Unknown decimation method '{method}', expected 'voxel' or 'random'.")
+    origin = points.min(axis=0)
+    extent = np.maximum(np.ptp(points, axis=0), np.finfo(np.float64).tiny)
+
+    def cells(resolution):
+        ijk = np.minimum(((points - origin) / extent * resolution).astype(np.int64), resolution - 1)
+        keys = (ijk[:, 0] * resolution + ijk[:, 1]) * resolution + ijk[:, 2]
+        return np.unique(keys, return_index=True)[1]
+
+    # Bisect for the largest grid resolution whose occupied cells fit the limit.
+    low, high = 1, max(2, int(round(max_points ** (1 / 3))) * 16)
+    best = cells(low)
+    while high - low > 1:
+        middle = (low + high) // 2
+        first = cells(middle)
+        if len(first) <= max_points:
+            low, best = middle, first
+        else:
+            high = middle
+    return points[np.sort(best)]
+
+
+def _grid_index(n, max_size):
+    step = -(-n // max_size)
+    index = np.arange(0, n, step)
+    if index[-1] != n - 1:
+        index = np.append(index, n - 1)
+    return index
+
+
+def downsample_grid(z, max_size=DEFAULT_SURFACE_SIZE, x=None, y=None):
+    """
+    Strided subsample of a surface z[i, j] over axes x[i], y[j] to at most
+    about `max_size` samples per axis, always keeping the last row and
+    column so the plotted extent is unchanged. Returns (x, y, z).
+    """
+    z = np.asarray(z)
+    x = np.arange(z.shape[0]) if x is None else np.asarray(x)
+    y = np.arange(z.shape[1]) if y is None else np.asarray(y)
+    rows, columns = _grid_index(z.shape[0], max_size), _grid_index(z.shape[1], max_size)
+    return x[rows], y[columns], z[np.ix_(rows, columns)]
+
+
+def save_figure(fig, path):
+    """
+    Headless export of a Plotly (.html, or static images via kaleido) or
+    matplotlib figure; matplotlib figures are closed afterwards.
+    """
+    if hasattr(fig, "write_html"):
+        if path.endswith(".html"):
+            fig.write_html(path, include_plotlyjs="cdn")
+        else:
+            fig.write_image(path)
+        return
+    fig.savefig(path)
+    import matplotlib.pyplot as plt
+    plt.close(fig)
+
+
+def _timed_save(build, points, path):
+    start = time.perf_counter()
+    save_figure(build(points), path)
+    return time.perf_counter() - start
+
+
+def render_with_budget(build, path, budget, max_points, probe_points=PROBE_POINTS):
+    """
+    Exports the most detailed figure expected to render within `budget`
+    seconds, probes included. build(n) must return a figure drawn from at
+    most n points. Probe renders of probe_points // 10 and `probe_points`
+    fit a fixed per-figure overhead plus a per-point cost; the final size
+    is what the time left after the probes allows. Returns the point count
+    of the exported figure.
+    """
+    probe = min(probe_points, max_points)
+    small = max(1, probe // 10)
+    if probe <= small:
+        _timed_save(build, probe, path)
+        return probe
+    small_time = _timed_save(build, small, path)
+    probe_time = _timed_save(build, probe, path)
+    if probe == max_points:
+        return probe
+    per_point = max(probe_time - small_time, 0.0) / (probe - small)
+    overhead = max(small_time - small * per_point, 0.0)
+    remaining = budget - small_time - probe_time - overhead
+    if remaining <= probe * per_point:
+        return probe  # the probe export is already the largest that fits
+    points = max_points if per_point == 0 else min(max_points, int(remaining / per_point))
+    save_figure(build(points), path)
+    return points
@@ -1,12 +1,203 @@
+import hashlib
+import io
 import json
 import os
+import struct
+from collections.abc import Mapping
+import numpy as np
+from core.fileio import atomic_write
+from perf.profiling import profiled
+
+INDEX_MAGIC = b"EFXSAVE1"
+RECORD_MAGIC = b"EFXR"
+RECORD_HEADER = struct.Struct("<4sHQ")  # magic, name length, payload length
+COMPACT_MIN_BYTES = 1 << 20  # never compact data files smaller than this
 
 def save_game_state(filename: str, data: dict):
-    with open(filename, 'w') as f:
+    with atomic_write(filename, 'w') as f:
         json.dump(data, f, indent=2)
 
+@profiled()
 def load_game_state(filename: str) -> dict:
+    """Loads a JSON or binary save; binary saves are read in full."""
     if os.path.exists(filename):
+        if _is_binary_save(filename):
+            with LazyGameState(filename) as state:
+                return dict(state)
         with open(filename, 'r') as f:
             return json.load(f)
-    return {}
\ No newline at end of file
+    return {}
+
+
+def _is_binary_save(filename: str) -> bool:
+    with open(filename, 'rb') as f:
+        return f.read(len(INDEX_MAGIC)) == INDEX_MAGIC
+
+
+def _encode_section(value):
+    """NumPy arrays are stored as raw .npy bytes, everything else as compact JSON."""
+    if isinstance(value, np.ndarray):
+        buffer = io.BytesIO()
+        np.save(buffer, value, allow_pickle=False)
+        return "npy", buffer.getvalue()
+    return "json", json.dumps(value, separators=(",", ":")).encode()
+
+
+def _decode_section(codec, payload):
+    if codec == "npy":
+        return np.load(io.BytesIO(payload), allow_pickle=False)
+    return json.loads(payload)
+
+
+def _read_index(filename: str):
+    with open(filename, 'rb') as f:
+        if f.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+            raise ValueError(f"{filename} is not a binary save.")
+        return json.loads(f.read())
+
+
+def _section_name(key) -> str:
+    """Top-level keys become strings exactly as json.dump converts them."""
+    if isinstance(key, str):
+        return key
+    if key is None or isinstance(key, (int, float)):
+        return json.dumps(key)
+    raise TypeError(f"Save keys must be str, int, float, bool or None, not {type(key).__name__}.")
+
+
+def _data_path(filename: str, generation: int) -> str:
+    return f"{filename}.{generation}.dat"
+
+
+@profiled()
+def save_game_state_binary(filename: str, data: dict, dirty_sections=None):
+    """
+    Saves `data` in the binary format: one record per top-level key in an
+    append-only data file, plus a small index at `filename` that is
+    replaced atomically (write + rename). Sections whose bytes did not
+    change since the last save are not written again; pass
+    `dirty_sections` to skip re-encoding keys known to be unchanged.
+    Once dead records outweigh live ones the data file is compacted into
+    a new generation.
+    """
+    data = {_section_name(key): value for key, value in data.items()}
+    if dirty_sections is not None:
+        dirty_sections = {_section_name(key) for key in dirty_sections}
+    index = _read_index(filename) if os.path.exists(filename) and _is_binary_save(filename) else None
+    old_sections = index["sections"] if index else {}
+    generation = index["generation"] if index else 0
+    data_path = _data_path(filename, generation)
+    if index is None or not os.path.exists(data_path):
+        open(data_path, 'wb').close()
+        old_sections = {}
+
+    sections, pending = {}, []
+    for name, value in data.items():
+        if dirty_sections is not None and name not in dirty_sections and name in old_sections:
+            sections[name] = old_sections[name]
+            continue
+        codec, payload = _encode_section(value)
+        digest = hashlib.sha1(payload).hexdigest()
+        previous = old_sections.get(name)
+        if previous and previous[2] == codec and previous[3] == digest:
+            sections[name] = previous
+        else:
+            pending.append((name, codec, digest, payload))
+
+    live = sum(entry[1] for entry in sections.values()) + sum(len(p[3]) for p in pending)
+    size = os.path.getsize(data_path)
+    if size > COMPACT_MIN_BYTES and size - live > live:
+        pending += [(name, entry[2], entry[3], _read_payload(data_path, entry))
+                    for name, entry in sections.items()]
+        sections, generation = {}, generation + 1
+        data_path = _data_path(filename, generation)
+        open(data_path, 'wb').close()
+
+    with open(data_path, 'ab') as f:
+        offset = f.seek(0, os.SEEK_END)
+        for name, codec, digest, payload in pending:
+            encoded_name = name.encode()
+            f.write(RECORD_HEADER.pack(RECORD_MAGIC, len(encoded_name), len(payload)))
+            f.write(encoded_name)
+            offset += RECORD_HEADER.size + len(encoded_name)
+            f.write(payload)
+            sections[name] = [offset, len(payload), codec, digest]
+            offset += len(payload)
+        f.flush()
+        os.fsync(f.fileno())
+
+    index = {"generation": generation, "sections": sections}
+    with atomic_write(filename, fsync=True) as f:
+        f.write(INDEX_MAGIC + json.dumps(index).encode())
+    if generation and os.path.exists(_data_path(filename, generation - 1)):
+        os.remove(_data_path(filename, generation - 1))
+
+
+def _read_payload(data_path: str, entry) -> bytes:
+    with open(data_path, 'rb') as f:
+        f.seek(entry[0])
+        return f.read(entry[1])
+
+
+class LazyGameState(Mapping):
+    """
+    Read-only view of a binary save. Only the index is read up front;
+    each section is read and decoded on first access, then cached. The
+    data file is opened once, so the view keeps reading the save it was
+    opened on even after a later save compacts (and removes) that file.
+    """
+    def __init__(self, filename: str):
+        index = _read_index(filename)
+        self.sections = index["sections"]
+        self.data_path = _data_path(filename, index["generation"])
+        self._file = open(self.data_path, 'rb')
+        self._cache = {}
+
+    def __getitem__(self, name):
+        if name not in self._cache:
+            entry = self.sections[name]
+            self._file.seek(entry[0])
+            self._cache[name] = _decode_section(entry[2], self._file.read(entry[1]))
+        return self._cache[name]
+
+    def __iter__(self):
+        return iter(self.sections)
+
+    def __len__(self):
+        return len(self.sections)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class LoadedGameState(dict):
+    """A fully loaded JSON save (or {}) with the same close()/with API as LazyGameState."""
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_game_state_lazy(filename: str) -> Mapping:
+    """LazyGameState for binary saves; JSON saves are loaded eagerly as before."""
+    if os.path.exists(filename) and _is_binary_save(filename):
+        return LazyGameState(filename)
+    return LoadedGameState(load_game_state(filename))
+
+
+def migrate_json_save(filename: str):
+    """Converts an existing JSON save to the binary format under the same name."""
+    if os.path.exists(filename) and not _is_binary_save(filename):
+        with open(filename, 'r') as f:
+            data = json.load(f)
+        save_game_state_binary(filename, data)
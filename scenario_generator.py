@@ -1,9 +1,16 @@
 import random
+import threading
+import numpy as np
 
 class ScenarioGenerator:
     """
     Generates in-game yor AI-driven scenarios referencing advanced
     breakthroughs like Riemann Hypothesis, P vs NP, etc.
+
+    generate_batch() draws many scenarios at once from a per-session
+    np.random.Generator seeded with `seed`, so sessions are reproducible
+    and never touch the global `random` state. Each thread gets its own
+    child stream of the session seed, so concurrent callers share no lock.
     """
     potential_breakthroughs = [
         "Riemann Hypothesis: Higher-dimensional symmetry for quantum fields.",
@@ -13,6 +20,30 @@ class ScenarioGenerator:
         "Yang–Mills: Mass gap proven with symmetry-breaking.",
         "Hodge Conjecture: Advanced topology and string theory insights."
     ]
+    # How strongly each breakthrough leans towards Harmony (1.0) rather than Chaos (0.0).
+    harmony_affinity = [0.8, 0.4, 0.1, 0.7, 0.3, 0.9]
+
+    def __init__(self, seed=None, controller=None):
+        self.controller = controller
+        self._seed_sequence = np.random.SeedSequence(seed)
+        self._owner = threading.get_ident()
+        self._local = threading.local()
+        self._spawn_lock = threading.Lock()
+        self._tables = {}
+
+    @property
+    def rng(self):
+        """This thread's generator: the session stream on the creating thread, a spawned child elsewhere."""
+        rng = getattr(self._local, "rng", None)
+        if rng is None:
+            if threading.get_ident() == self._owner:
+                rng = np.random.default_rng(self._seed_sequence)
+            else:
+                with self._spawn_lock:
+                    child = self._seed_sequence.spawn(1)[0]
+                rng = np.random.default_rng(child)
+            self._local.rng = rng
+        return rng
 
     def generate_scenario(self):
         """
@@ -20,3 +51,57 @@ class ScenarioGenerator:
         for dynamic gameplay or puzzle creation.
         """
         return random.choice(self.potential_breakthroughs)
+
+    def scenario_weights(self, controller=None):
+        """Sampling weights from the controller's Harmony/Chaos status; uniform without one."""
+        controller = controller or self.controller
+        if controller is None:
+            return np.ones(len(self.potential_breakthroughs))
+        status = controller.get_status()
+        harmony = max(status["Harmony"], 0.0)
+        chaos = max(status["Chaos"], 0.0)
+        if harmony + chaos == 0:
+            return np.ones(len(self.potential_breakthroughs))
+        affinity = np.asarray(self.harmony_affinity)
+        return harmony * affinity + chaos * (1.0 - affinity)
+
+    def _alias_table(self, weights):
+        key = tuple(np.round(weights, 6))
+        table = self._tables.get(key)
+        if table is None:
+            table = build_alias_table(weights)
+            if len(self._tables) >= 256:
+                self._tables.clear()
+            self._tables[key] = table
+        return table
+
+    def draw_indices(self, n, controller=None):
+        """Indices into potential_breakthroughs for `n` weighted draws, O(1) each."""
+        prob, alias = self._alias_table(self.scenario_weights(controller))
+        rng = self.rng
+        columns = rng.integers(len(prob), size=n)
+        return np.where(rng.random(n) < prob[columns], columns, alias[columns])
+
+    def generate_batch(self, n, controller=None):
+        """Returns `n` scenarios weighted by the current Harmony/Chaos status."""
+        return [self.potential_breakthroughs[i] for i in self.draw_indices(n, controller)]
+
+
+def build_alias_table(weights):
+    """Vose's alias method: (prob, alias) arrays for O(1) weighted sampling."""
+    weights = np.asarray(weights, dtype=np.float64)
+    if weights.ndim != 1 or len(weights) == 0 or np.any(weights < 0) or weights.sum() <= 0:
+        raise ValueError("Weights must be a non-empty 1-D array of non-negative values with a positive sum.")
+    size = len(weights)
+    scaled = weights * (size / weights.sum())
+    prob = np.ones(size)
+    alias = np.arange(size)
+    small = [i for i in range(size) if scaled[i] < 1.0]
+    large = [i for i in range(size) if scaled[i] >= 1.0]
+    while small and large:
+        lo, hi = small.pop(), large.pop()
+        prob[lo] = scaled[lo]
+        alias[lo] = hi
+        scaled[hi] -= 1.0 - scaled[lo]
+        (small if scaled[hi] < 1.0 else large).append(hi)
+    return prob, alias
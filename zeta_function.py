@@ -0,0 +1,444 @@
+# zeta_function.py
+
+import hashlib
+import math
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from mpmath import zetazero, zeta, nzeros
+from core.fileio import atomic_write
+from perf.profiling import profiled
+
+DEFAULT_TOLERANCE = 1e-8  # absolute error bound for the vectorized engine
+EM_TERMS = 12  # Bernoulli correction terms in the Euler–Maclaurin tail
+MAX_EM_N = 1 << 16
+SUM_CHUNK = 2048  # n-terms per matrix product in the direct sum
+DEFAULT_TILE_SIZE = 64  # grid points per tile side
+LATTICE_TOLERANCE = 1e-12  # relative distance below which an axis is snapped to the tile lattice
+Z_BLOCK = 512  # heights per evaluate_zeta_grid call when sampling Z(t)
+GRAM_START = 10.0  # below the first zero (14.13); theta expansion is accurate from here
+MAX_SUBDIVISIONS = 64  # samples per Gram interval before giving up on a window
+MAX_ROOT_ITERATIONS = 60
+
+# B_2, B_4, ..., B_26 (the last one only feeds the remainder bound)
+BERNOULLI = [
+    1/6, -1/30, 1/42, -1/30, 5/66, -691/2730, 7/6, -3617/510, 43867/798,
+    -174611/330, 854513/138, -236364091/2730, 8553103/6,
+]
+EM_COEFFICIENTS = [b / math.factorial(2 * (k + 1)) for k, b in enumerate(BERNOULLI)]
+
+
+def _em_tail(s, N, terms=EM_TERMS):
+    """
+    Euler–Maclaurin tail for sum_{n>=N} n^-s and the remainder bound
+    |s(s+1)...(s+2m+1) B_{2m+2} N^(-sigma-2m-1) / ((2m+2)! (sigma+2m+1))|.
+    """
+    n_pow = np.exp(-s * math.log(N))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tail = N * n_pow / (s - 1) + n_pow / 2
+    poch = s.copy()
+    power = n_pow / N
+    for k in range(terms):
+        tail += EM_COEFFICIENTS[k] * poch * power
+        poch *= (s + 2 * k + 1) * (s + 2 * k + 2)
+        power /= N * N
+    with np.errstate(divide='ignore', invalid='ignore'):
+        bound = np.abs(EM_COEFFICIENTS[terms] * poch * (s + 2 * terms + 1) * power)
+        bound /= s.real + 2 * terms + 1
+    bound[(s.real + 2 * terms + 1 <= 0) | (s == 1)] = np.inf
+    return tail, bound
+
+
+def _rounding_bound(s, N):
+    """
+    Floating-point error estimate for summing N terms of size up to
+    max(1, N^-sigma) whose phases t*log(n) carry absolute rounding error.
+    Per-term errors are independent, so they grow like sqrt(N), not N.
+    """
+    phase_error = 1 + np.abs(s) * math.log(N)
+    return 8 * np.finfo(np.float64).eps * math.sqrt(N) * np.maximum(1.0, float(N) ** -s.real) * phase_error
+
+
+def _choose_n(s, tol):
+    """
+    Smallest power-of-two N (>= |s|/2pi) whose remainder bound meets tol
+    everywhere it still can: points where a larger N would only add more
+    rounding error than tol are left to the mpmath fallback, and so is
+    the pole s = 1, whose bound no N can meet.
+    """
+    N = max(8, 1 << int(np.abs(s).max() / (2 * math.pi)).bit_length())
+    regular = s != 1
+    while N < MAX_EM_N:
+        _, bound = _em_tail(s, N)
+        if not np.any((bound > tol) & (_rounding_bound(s, 2 * N) <= tol) & regular):
+            break
+        N *= 2
+    return N
+
+
+def evaluate_zeta_grid(real_range, imag_range, tol=DEFAULT_TOLERANCE, rtol=0.0, return_error=False):
+    """
+    zeta(sigma + it) on the whole real_range x imag_range grid at once,
+    in double precision.
+
+    The leading sum over n < N is separable in sigma and t, so it runs as
+    chunked matrix products; the tail uses Euler–Maclaurin with a rigorous
+    remainder bound plus a rounding estimate. Points whose bound exceeds
+    tol + rtol * |zeta| (or s = 1) fall back to mpmath. With
+    return_error=True the per-point bound is returned too.
+
+    `tol` alone is an absolute bound. Left of the critical strip |zeta|
+    grows like |t|^(1/2 - sigma), and double precision cannot reach 1e-8
+    absolute there: on [-2, 2] x [0, 100] about 2% of the points fall back
+    to mpmath and dominate the run time. Pass rtol (e.g. 1e-10) to accept
+    a relative error on those points instead.
+    """
+    sigma = np.asarray(real_range, dtype=np.float64)
+    t = np.asarray(imag_range, dtype=np.float64)
+    s = sigma[:, None] + 1j * t[None, :]
+    if s.size == 0:
+        return (s, np.zeros(s.shape)) if return_error else s
+    N = _choose_n(s, tol)
+
+    values = np.zeros(s.shape, dtype=np.complex128)
+    for start in range(1, N, SUM_CHUNK):
+        log_n = np.log(np.arange(start, min(start + SUM_CHUNK, N), dtype=np.float64))
+        moduli = np.exp(-np.outer(sigma, log_n))
+        phases = np.exp(-1j * np.outer(log_n, t))
+        values += moduli @ phases
+    tail, bound = _em_tail(s, N)
+    values += tail
+    bound += _rounding_bound(s, N) + 4 * np.finfo(np.float64).eps * np.abs(values)
+
+    fallback = ~(bound <= (tol + rtol * np.abs(values) if rtol else tol))
+    for i, j in zip(*np.nonzero(fallback)):
+        if s[i, j] == 1:
+            values[i, j], bound[i, j] = complex(np.inf), 0.0
+            continue
+        values[i, j] = complex(zeta(complex(sigma[i], t[j])))
+        bound[i, j] = np.finfo(np.float64).eps * abs(values[i, j])
+    if return_error:
+        return values, bound
+    return values
+
+
+class ZetaTileCache:
+    """
+    |zeta| tiles keyed by (real values, imag values, tolerances). Kept in an
+    LRU dict and, when `directory` is given, also persisted as .npy files
+    so later sessions and other processes reuse them.
+    """
+    def __init__(self, directory=None, max_tiles=4096):
+        self.directory = directory
+        self.max_tiles = max_tiles
+        self.tiles = OrderedDict()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(real, imag, tol, rtol=0.0) -> str:
+        digest = hashlib.sha1(real.tobytes())
+        digest.update(imag.tobytes())
+        digest.update(repr(float(tol)).encode())
+        if rtol:
+            digest.update(repr(float(rtol)).encode())
+        return digest.hexdigest()
+
+    def get(self, key):
+        if key in self.tiles:
+            self.tiles.move_to_end(key)
+            return self.tiles[key]
+        if self.directory:
+            path = os.path.join(self.directory, key + ".npy")
+            if os.path.exists(path):
+                tile = np.load(path)
+                self._remember(key, tile)
+                return tile
+        return None
+
+    def put(self, key, tile):
+        self._remember(key, tile)
+        if self.directory:
+            with atomic_write(os.path.join(self.directory, key + ".npy")) as f:
+                np.save(f, tile)
+
+    def _remember(self, key, tile):
+        self.tiles[key] = tile
+        self.tiles.move_to_end(key)
+        while len(self.tiles) > self.max_tiles:
+            self.tiles.popitem(last=False)
+
+
+TILE_CACHE = ZetaTileCache()
+
+
+def _imag_tiles(imag, tile_size):
+    """
+    Splits the imaginary axis into (tile_imag, dest_lo, dest_hi, src_lo).
+    Uniformly spaced axes that lie on a global lattice k * step are snapped
+    to it, so a panned view with the same spacing lands on the same tiles;
+    any other axis is tiled on its exact values.
+    """
+    n = len(imag)
+    exact = [(imag[lo:lo + tile_size], lo, min(lo + tile_size, n), 0) for lo in range(0, n, tile_size)]
+    step = imag[1] - imag[0] if n > 1 else 0.0
+    if step <= 0 or not np.allclose(np.diff(imag), step, rtol=1e-9, atol=0):
+        return exact
+    step = float(f"{step:.12g}")
+    k0 = int(round(imag[0] / step))
+    lattice = (k0 + np.arange(n, dtype=np.float64)) * step
+    if np.abs(lattice - imag).max() > LATTICE_TOLERANCE * max(1.0, np.abs(imag).max()):
+        return exact
+    tiles = []
+    for index in range(k0 // tile_size, (k0 + n - 1) // tile_size + 1):
+        k_lo, k_hi = index * tile_size, (index + 1) * tile_size
+        tile_imag = np.arange(k_lo, k_hi, dtype=np.float64) * step
+        lo, hi = max(k_lo, k0), min(k_hi, k0 + n)
+        tiles.append((tile_imag, lo - k0, hi - k0, lo - k_lo))
+    return tiles
+
+
+def _evaluate_tile(task):
+    real, imag, tol, rtol = task
+    return np.abs(evaluate_zeta_grid(real, imag, tol, rtol))
+
+
+def calculate_zeta_tiles(REAL_RANGE, IMAG_RANGE, tol=DEFAULT_TOLERANCE, tile_size=DEFAULT_TILE_SIZE,
+                         workers=1, cache=None, rtol=0.0):
+    """
+    |zeta(s)| over REAL_RANGE x IMAG_RANGE assembled from cached tiles.
+    Only tiles missing from `cache` (default TILE_CACHE) are computed,
+    across `workers` processes when workers > 1.
+    """
+    cache = TILE_CACHE if cache is None else cache
+    real = np.asarray(REAL_RANGE, dtype=np.float64)
+    imag = np.asarray(IMAG_RANGE, dtype=np.float64)
+    zeta_values = np.zeros((len(real), len(imag)))
+    if zeta_values.size == 0:
+        return zeta_values
+
+    # Tiles are held here for assembly: the cache may evict them before this call is done.
+    placements, tiles, missing = [], {}, {}
+    for row in range(0, len(real), tile_size):
+        tile_real = real[row:row + tile_size]
+        for tile_imag, lo, hi, src in _imag_tiles(imag, tile_size):
+            key = cache.key(tile_real, tile_imag, tol, rtol)
+            placements.append((key, row, row + len(tile_real), lo, hi, src))
+            if key in tiles or key in missing:
+                continue
+            tile = cache.get(key)
+            if tile is None:
+                missing[key] = (tile_real, tile_imag, tol, rtol)
+            else:
+                tiles[key] = tile
+
+    if workers > 1 and len(missing) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            computed = executor.map(_evaluate_tile, missing.values())
+            for key, tile in zip(missing, computed):
+                cache.put(key, tile)
+                tiles[key] = tile
+    else:
+        for key, task in missing.items():
+            tiles[key] = _evaluate_tile(task)
+            cache.put(key, tiles[key])
+
+    for key, row_lo, row_hi, lo, hi, src in placements:
+        zeta_values[row_lo:row_hi, lo:hi] = tiles[key][:, src:src + hi - lo]
+    return zeta_values
+
+
+def refine_zeta_values(REAL_RANGE, IMAG_RANGE, levels=3, **tile_options):
+    """
+    Coarse-to-fine surface: yields (real, imag, |zeta|) on every
+    2**level-th grid point, halving the stride each time and ending with
+    the full grid. Each level goes through calculate_zeta_tiles().
+    """
+    real = np.asarray(REAL_RANGE, dtype=np.float64)
+    imag = np.asarray(IMAG_RANGE, dtype=np.float64)
+    for level in range(levels, -1, -1):
+        stride = 1 << level
+        real_sub, imag_sub = real[::stride], imag[::stride]
+        yield real_sub, imag_sub, calculate_zeta_tiles(real_sub, imag_sub, **tile_options)
+
+
+@profiled()
+def calculate_zeta_values(REAL_RANGE, IMAG_RANGE, method="vectorized", tol=DEFAULT_TOLERANCE, rtol=0.0,
+                          **tile_options):
+    """
+    |zeta(s)| over REAL_RANGE x IMAG_RANGE. method="tiled" goes through
+    the tile cache (tile_size, workers, cache); method="mpmath" keeps the
+    original point-by-point loop as a reference. See evaluate_zeta_grid()
+    for tol and rtol.
+    """
+    if method == "vectorized":
+        return np.abs(evaluate_zeta_grid(REAL_RANGE, IMAG_RANGE, tol, rtol))
+    if method == "tiled":
+        return calculate_zeta_tiles(REAL_RANGE, IMAG_RANGE, tol, rtol=rtol, **tile_options)
+    if method != "mpmath":
+        raise ValueError(f"Unknown method '{method}', expected 'vectorized', 'tiled' or 'mpmath'.")
+    zeta_values = np.zeros((len(REAL_RANGE), len(IMAG_RANGE)))
+    for i, real in enumerate(REAL_RANGE):
+        for j, imag in enumerate(IMAG_RANGE):
+            zeta_values[i, j] = abs(zeta(complex(real, imag)))
+    return zeta_values
+
+
+def siegel_theta(t):
+    """Riemann–Siegel theta via its asymptotic expansion (accurate for t >= GRAM_START)."""
+    t = np.asarray(t, dtype=np.float64)
+    return (t / 2 * np.log(t / (2 * math.pi)) - t / 2 - math.pi / 8
+            + 1 / (48 * t) + 7 / (5760 * t ** 3) + 31 / (80640 * t ** 5) + 127 / (430080 * t ** 7))
+
+
+def siegel_z(t, tol=DEFAULT_TOLERANCE):
+    """Hardy's Z(t) = exp(i theta(t)) zeta(1/2 + it), real-valued, for sorted heights t."""
+    t = np.asarray(t, dtype=np.float64)
+    values = np.empty(len(t))
+    for lo in range(0, len(t), Z_BLOCK):
+        block = t[lo:lo + Z_BLOCK]
+        zeta_line = evaluate_zeta_grid([0.5], block, tol)[0]
+        values[lo:lo + Z_BLOCK] = (np.exp(1j * siegel_theta(block)) * zeta_line).real
+    return values
+
+
+def gram_points(n):
+    """Gram points g_n, theta(g_n) = n*pi, for an array of indices n >= -1 (Newton's method)."""
+    n = np.asarray(n, dtype=np.float64)
+    # theta is convex past 2*pi, so Newton from the right converges monotonically.
+    g = np.maximum(50.0, 2 * math.pi * (n + 1))
+    for _ in range(MAX_ROOT_ITERATIONS):
+        step = (siegel_theta(g) - n * math.pi) / (0.5 * np.log(g / (2 * math.pi)))
+        g -= step
+        if np.all(np.abs(step) <= 1e-13 * g):
+            break
+    return g
+
+
+def _refine_zeros(a, b, za, zb, tol):
+    """Vectorized Illinois iteration on brackets [a, b] with sign(Z(a)) != sign(Z(b))."""
+    a, b, za, zb = a.copy(), b.copy(), za.copy(), zb.copy()
+    active = np.arange(len(a))
+    for _ in range(MAX_ROOT_ITERATIONS):
+        if len(active) == 0:
+            break
+        ia, ib, fa, fb = a[active], b[active], za[active], zb[active]
+        c = (ia * fb - ib * fa) / (fb - fa)
+        fc = siegel_z(c, tol)
+        keep_a = np.signbit(fc) == np.signbit(fb)
+        a[active] = np.where(keep_a, ia, ib)
+        za[active] = np.where(keep_a, fa / 2, fb)
+        b[active], zb[active] = c, fc
+        converged = (np.abs(b[active] - a[active]) <= 1e-12 * b[active]) | (fc == 0)
+        active = active[~converged]
+    return b
+
+
+def critical_zeros_between(lo, hi, tol=DEFAULT_TOLERANCE):
+    """
+    Ordinates of all zeros 1/2 + it with lo <= t < hi, in one sweep.
+
+    Z(t) is sampled at the Gram points in the window, subdivided until the
+    number of sign changes matches mpmath's verified zero count N(hi) - N(lo);
+    every bracket is then refined together.
+    """
+    lo = max(float(lo), GRAM_START)
+    hi = float(hi)
+    if hi <= lo:
+        return np.zeros(0)
+    expected = int(nzeros(hi)) - int(nzeros(lo))
+    first_gram = int(math.floor(siegel_theta(lo) / math.pi))
+    last_gram = int(math.ceil(siegel_theta(hi) / math.pi))
+    grams = gram_points(np.arange(first_gram, last_gram + 1))
+    knots = np.unique(np.concatenate(([lo], grams[(grams > lo) & (grams < hi)], [hi])))
+    subdivisions = 2
+    while True:
+        steps = np.arange(subdivisions) / subdivisions
+        t = np.append((knots[:-1, None] + np.diff(knots)[:, None] * steps).ravel(), hi)
+        z = siegel_z(t, tol)
+        changes = np.flatnonzero(np.signbit(z[:-1]) != np.signbit(z[1:]))
+        if len(changes) == expected:
+            break
+        if subdivisions >= MAX_SUBDIVISIONS:
+            raise RuntimeError(f"Found {len(changes)} of {expected} zeros in [{lo}, {hi}).")
+        subdivisions *= 2
+    return _refine_zeros(t[changes], t[changes + 1], z[changes], z[changes + 1], tol)
+
+
+def critical_zeros(count, tol=DEFAULT_TOLERANCE):
+    """Ordinates of the first `count` nontrivial zeros, in one sweep."""
+    zeros = np.zeros(0)
+    margin = 2
+    while len(zeros) < count:
+        zeros = critical_zeros_between(0, float(gram_points(count + margin)), tol)
+        margin *= 2
+    return zeros[:count]
+
+
+class ZeroTable:
+    """
+    On-disk table of zero ordinates in height order. `<path>.table.npy`
+    is one float64 array, memory-mapped on load: element 0 is the height
+    scanned so far and the rest are the sorted ordinates, so both are
+    replaced by a single atomic rename. Zero n is a direct index and a
+    height window is two binary searches; the table grows on demand.
+    """
+    def __init__(self, path, tol=DEFAULT_TOLERANCE):
+        self.path = path
+        self.tol = tol
+        self.height = GRAM_START
+        self.zeros = np.zeros(0)
+        if os.path.exists(self._file):
+            self._load()
+
+    def __len__(self):
+        return len(self.zeros)
+
+    def extend_to_height(self, height):
+        if height <= self.height:
+            return
+        found = critical_zeros_between(self.height, height, self.tol)
+        self.zeros = np.concatenate((self.zeros, found))
+        self.height = float(height)
+        self._save()
+
+    def extend_to_count(self, count):
+        margin = 2
+        while len(self.zeros) < count:
+            self.extend_to_height(float(gram_points(count + margin)))
+            margin *= 2
+
+    def zero(self, n):
+        """Ordinate of the n-th zero (1-indexed)."""
+        self.extend_to_count(n)
+        return float(self.zeros[n - 1])
+
+    def first(self, count):
+        self.extend_to_count(count)
+        return self.zeros[:count]
+
+    def between(self, lo, hi):
+        """Zeros with lo <= t < hi, plus the 1-based index of the first one."""
+        self.extend_to_height(hi)
+        start, stop = np.searchsorted(self.zeros, [lo, hi])
+        return self.zeros[start:stop], int(start) + 1
+
+    @property
+    def _file(self):
+        return self.path + ".table.npy"
+
+    def _save(self):
+        with atomic_write(self._file) as f:
+            np.save(f, np.concatenate(([self.height], self.zeros)))
+        self._load()
+
+    def _load(self):
+        table = np.load(self._file, mmap_mode='r')
+        self.height = float(table[0])
+        self.zeros = table[1:]
+
+
+def extract_critical_zeros(n):
+    critical_zeros = zetazero(n)
+    return critical_zeros
@@ -0,0 +1,67 @@
+# zeta_visualizer.py
+
+import numpy as np
+import plotly.graph_objects as go
+from visualization.rendering import DEFAULT_SURFACE_SIZE, downsample_grid
+
+def _zero_heights(critical_zeros):
+    """Heights of critical zeros given as floats (critical_zeros) or mpc values (extract_critical_zeros)."""
+    if not isinstance(critical_zeros, (list, tuple, np.ndarray)):
+        critical_zeros = [critical_zeros]
+    zeros = np.asarray(critical_zeros)
+    if zeros.dtype.kind in "iuf":
+        return zeros.astype(np.float64)
+    return np.array([complex(z).imag for z in critical_zeros])
+
+
+def create_3d_visualization(zeta_values, critical_zeros, llm_insight, real_range=None, imag_range=None,
+                            max_size=DEFAULT_SURFACE_SIZE):
+    """
+    Zeta magnitude surface with critical zeros and the LLM insight.
+    Grids larger than `max_size` per axis are subsampled before they are
+    handed to Plotly (Surface and Scatter3d both render through WebGL).
+    """
+    real_range, imag_range, zeta_values = downsample_grid(zeta_values, max_size, real_range, imag_range)
+    fig = go.Figure(data=[go.Surface(
+        x=real_range,
+        y=imag_range,
+        z=zeta_values.T,
+        colorscale="Viridis",
+        name="Zeta Function Dynamics"
+    )])
+
+    # Add critical zeros markers
+    heights = _zero_heights(critical_zeros)
+    fig.add_trace(go.Scatter3d(
+        x=np.full(len(heights), 0.5),
+        y=heights,
+        z=np.zeros(len(heights)),
+        mode="markers",
+        marker=dict(size=7, color="red", opacity=0.8),
+        name="Critical Zeros"
+    ))
+
+    # Add LLM-generated insights as annotations
+    fig.add_trace(go.Scatter3d(
+        x=[0.5],
+        y=[10],
+        z=[0],
+        mode="text",
+        text=[llm_insight],
+        textposition="top center",
+        name="LLM Insights"
+    ))
+
+    # Update layout for enhanced visualization
+    fig.update_layout(
+        title="EternaFX Imagine: Zeta Function Dynamics with LLM Insights",
+        scene=dict(
+            xaxis_title="Re(s) (Real Part)",
+            yaxis_title="Im(s) (Imaginary Part)",
+            zaxis_title="|ζ(s)| (Magnitude)",
+        ),
+        margin=dict(l=0, r=0, t=40, b=0),
+        legend=dict(x=0.1, y=0.9)
+    )
+
+    return fig